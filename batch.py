@@ -0,0 +1,171 @@
+import json
+import os
+import time
+
+from cache import CACHE_DIR
+from gpt import (GENERATION_PARAMS, REFRESH, _cache_entry, build_messages, get_response_cache, is_truncated,
+                 plan_request, record_usage, response_key, write_lesson)
+
+# One state file per submitted batch, so an interrupted run can pick up the
+# same batch instead of paying for it twice.
+BATCH_DIR = os.path.join(CACHE_DIR, "batches")
+POLL_INTERVAL = float(os.getenv("OPENAI_BATCH_POLL", "30"))
+COMPLETION_WINDOW = "24h"
+TERMINAL_STATES = {"completed", "failed", "expired", "cancelled"}
+
+
+def _state_path(name):
+    return os.path.join(BATCH_DIR, f"{name}.json")
+
+
+def _input_path(name):
+    return os.path.join(BATCH_DIR, f"{name}.jsonl")
+
+
+def _load_state(name):
+    try:
+        with open(_state_path(name), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def _save_state(name, state):
+    os.makedirs(BATCH_DIR, exist_ok=True)
+    path = _state_path(name)
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(state, f)
+    os.replace(path + ".tmp", path)
+
+
+def write_batch_file(jobs, path, refresh=None, written=None):
+    """Write one chat.completions request per (prompt, file_name, file_path) job to `path`.
+
+    Lessons with a cached completion are written out straight away, and into
+    `written` if given, and left out of the batch. Returns
+    {custom_id: [file_name, file_path]} for the rest.
+    """
+    refresh = REFRESH if refresh is None else refresh
+    cache = get_response_cache()
+    targets = {}
+    with open(path, "w", encoding="utf-8") as f:
+        for prompt, file_name, file_path in jobs:
+            key = response_key(prompt)
+            cached = None if refresh else cache.get(key)
+            if cached is not None:
+                content = json.loads(cached)["content"]
+                write_lesson(content, file_name, file_path)
+                if written is not None:
+                    written[(file_path, file_name)] = content
+                continue
+            if key in targets:
+                # Same lesson body twice: convert once, write both.
+                targets[key].extend([file_name, file_path])
+                continue
+            plan = plan_request(prompt)
+            if plan.status == "too-big":
+                print(f"✗ {file_name}: {plan.prompt_tokens} prompt tokens don't fit {plan.model}, left out")
+                continue
+            targets[key] = [file_name, file_path]
+            body = {"model": plan.model, "messages": build_messages(prompt),
+                    "max_completion_tokens": plan.max_tokens, **GENERATION_PARAMS}
+            request = {"custom_id": key, "method": "POST", "url": "/v1/chat/completions", "body": body}
+            f.write(json.dumps(request) + "\n")
+    return targets
+
+
+def _submit(client, name, jobs, refresh, written):
+    os.makedirs(BATCH_DIR, exist_ok=True)
+    input_path = _input_path(name)
+    targets = write_batch_file(jobs, input_path, refresh, written)
+    if not targets:
+        os.remove(input_path)
+        return None
+    with open(input_path, "rb") as f:
+        input_file = client.files.create(file=f, purpose="batch")
+    batch = client.batches.create(
+        input_file_id=input_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window=COMPLETION_WINDOW,
+        metadata={"topic": name},
+    )
+    state = {"batch_id": batch.id, "input_file_id": input_file.id, "targets": targets}
+    _save_state(name, state)
+    print(f"Submitted batch {batch.id} for {name} ({len(targets)} lessons)")
+    return state
+
+
+def _fan_out(client, batch, targets):
+    """Write every complete result to its lesson file(s) and the response cache."""
+    from openai.types.chat import ChatCompletion
+
+    cache = get_response_cache()
+    written = {}
+    failed = 0
+    if batch.output_file_id:
+        for line in client.files.content(batch.output_file_id).text.splitlines():
+            if not line.strip():
+                continue
+            result = json.loads(line)
+            target = targets.get(result["custom_id"])
+            response = result.get("response") or {}
+            if target is None or response.get("status_code") != 200:
+                failed += 1
+                continue
+            resp = ChatCompletion.model_validate(response["body"])
+            record_usage(resp, target[0], target[1])
+            # A cut-off page is neither cached nor written, so the lesson is left
+            # failed and the next interactive run converts it with continuations.
+            if is_truncated(resp):
+                print(f"⚠ {target[0]}: batch reply cut off ({resp.choices[0].finish_reason}), left for the next run")
+                failed += 1
+                continue
+            content = resp.choices[0].message.content
+            cache.put(result["custom_id"], _cache_entry(resp))
+            for file_name, file_path in zip(target[0::2], target[1::2]):
+                write_lesson(content, file_name, file_path)
+                written[(file_path, file_name)] = content
+    if batch.error_file_id:
+        failed += sum(1 for line in client.files.content(batch.error_file_id).text.splitlines() if line.strip())
+    return written, failed
+
+
+def run_batch(jobs, name, refresh=None, poll_interval=POLL_INTERVAL, client=None):
+    """Convert a whole topic through the Batch API.
+
+    `jobs` are (prompt, file_name, file_path) tuples as for gpt.ask_all and
+    `name` identifies the batch, usually the topic folder name. If a batch for
+    `name` is still pending from an earlier run it is resumed and `jobs` is not
+    read at all. Returns {(file_path, file_name): content} for the lessons
+    written, from the batch or the response cache; anything that failed is
+    left uncached, so running again resubmits only that.
+    """
+    if client is None:
+        from openai import OpenAI
+        client = OpenAI()
+    served = {}
+    state = _load_state(name)
+    if state is None:
+        state = _submit(client, name, jobs, refresh, served)
+        if state is None:
+            print(f"✓ {name}: every lesson served from the response cache")
+            return served
+    else:
+        print(f"Resuming batch {state['batch_id']} for {name}")
+
+    while True:
+        batch = client.batches.retrieve(state["batch_id"])
+        if batch.status in TERMINAL_STATES:
+            break
+        counts = batch.request_counts
+        if counts is not None:
+            print(f"… {name}: {batch.status}, {counts.completed}/{counts.total} done")
+        time.sleep(poll_interval)
+
+    written, failed = _fan_out(client, batch, state["targets"])
+    os.remove(_state_path(name))
+    if os.path.exists(_input_path(name)):
+        os.remove(_input_path(name))
+    mark = "✓" if batch.status == "completed" and not failed else "⚠"
+    print(f"{mark} {name}: batch {batch.status}, {len(written)} lessons written, {failed} failed")
+    return {**served, **written}
@@ -0,0 +1,202 @@
+import argparse
+import asyncio
+import contextlib
+import glob
+import io
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from bs4 import BeautifulSoup
+
+from clean import MINIFY_LEVELS, estimate_tokens, minify_report, strip_boilerplate
+from test import extract_folders, extract_lesson_body, natural_sort_key
+
+
+def _corpus(root):
+    files = glob.glob(os.path.join(root, "*", "*.html"))
+    files.sort(key=natural_sort_key)
+    return files
+
+
+def _html5lib_body(html_file):
+    """The original extraction path, kept here only as a baseline."""
+    with open(html_file, 'r', encoding='utf-8') as file:
+        html_content = file.read()
+    body = BeautifulSoup(html_content, 'html5lib').find('body')
+    return str(body) if body else None
+
+
+def _measure(extract, files):
+    tracemalloc.start()
+    start = time.perf_counter()
+    peak = 0
+    for html_file in files:
+        tracemalloc.reset_peak()
+        extract(html_file)
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+    elapsed = time.perf_counter() - start
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def bench_extract(root, limit=None):
+    files = _corpus(root)[:limit]
+    print(f"Extracting {len(files)} pages under {root}")
+    fast_time, fast_peak = _measure(extract_lesson_body, files)
+    print(f"streaming  {fast_time:8.2f}s  peak {fast_peak / 2**20:7.1f} MB")
+    slow_time, slow_peak = _measure(_html5lib_body, files)
+    print(f"html5lib   {slow_time:8.2f}s  peak {slow_peak / 2**20:7.1f} MB")
+    print(f"speedup    {slow_time / fast_time:8.1f}x")
+
+
+def bench_minify(folder):
+    """Total bytes and estimated tokens of a topic's cleaned lessons per minify level."""
+    files = glob.glob(os.path.join(folder, "*.html"))
+    files.sort(key=natural_sort_key)
+    totals = {level: [0, 0] for level in MINIFY_LEVELS}
+    base = 0
+    for html_file in files:
+        body = extract_lesson_body(html_file)
+        if not body:
+            continue
+        body, _ = strip_boilerplate(body)
+        base += estimate_tokens(body)
+        for level, (output, tokens, _) in minify_report(body).items():
+            totals[level][0] += len(output.encode("utf-8"))
+            totals[level][1] += tokens
+    print(f"{len(files)} pages in {folder}")
+    for level, (size, tokens) in totals.items():
+        print(f"{level:9} {size / 1024:9.1f} KB  ~{tokens:8} tokens  delta {base - tokens:8}")
+
+
+def bench_parallel(root, worker_counts):
+    """Wall time of extracting every topic folder under `root` per worker count."""
+    folders = sorted({os.path.dirname(html_file) for html_file in _corpus(root)}, key=natural_sort_key)
+    baseline = None
+    for workers in worker_counts:
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            extract_folders(folders, workers=workers, cache=False)
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed * workers
+        print(f"{workers:3} workers  {elapsed:8.2f}s  efficiency {baseline / (elapsed * workers):5.0%}")
+
+
+def bench_prompt_cache(path):
+    """Provider prompt-cache hit rate and latency saved per topic, from the usage log."""
+    from gpt import USAGE_LOG_PATH, usage_report
+    usage_report(path or USAGE_LOG_PATH)
+
+
+def bench_models(path):
+    """Latency and cost per model from the usage log, e.g. to compare routing tiers."""
+    from gpt import USAGE_LOG_PATH, model_report
+    model_report(path or USAGE_LOG_PATH)
+
+
+def bench_startup(modules, runs, budget):
+    """Time importing `modules` in a fresh interpreter, against an empty one.
+
+    Runs without OPENAI_API_KEY and in an empty folder, so an import that
+    creates a client or converts anything fails or leaves files behind.
+    Exits non-zero if the median import takes longer than `budget` seconds.
+    """
+    env = {key: value for key, value in os.environ.items() if key != "OPENAI_API_KEY"}
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [os.path.dirname(os.path.abspath(__file__)),
+                                                       env.get("PYTHONPATH")]))
+    code = "import " + ", ".join(modules)
+
+    def timed(source, cwd):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", source], cwd=cwd, env=env, check=True)
+        return time.perf_counter() - start
+
+    with tempfile.TemporaryDirectory() as cwd:
+        timed(code, cwd)  # warm up, and compile the .pyc files
+        baseline = statistics.median(timed("pass", cwd) for _ in range(runs))
+        elapsed = statistics.median(timed(code, cwd) for _ in range(runs))
+        left_behind = os.listdir(cwd)
+    cost = elapsed - baseline
+    print(f"{code}: {cost * 1000:.0f} ms over a bare interpreter ({baseline * 1000:.0f} ms), median of {runs}")
+    if left_behind:
+        print(f"✗ importing left files behind: {', '.join(left_behind)}")
+    if cost > budget or left_behind:
+        sys.exit(1)
+
+
+def bench_concurrency(lessons, concurrency, lesson_bytes, pause):
+    """Fixed vs. adaptive concurrency against whatever OPENAI_BASE_URL points at.
+
+    Meant for mock_openai.py started with --rpm/--tpm quotas; every lesson is
+    sent with refresh=True so the response cache doesn't hide the API, and the
+    runs are `pause` seconds apart so each starts with a refilled quota.
+    """
+    import gpt
+    prompts = [f"<p>lesson {i} " + "x" * lesson_bytes + "</p>" for i in range(lessons)]
+    for adaptive in (False, True):
+        if adaptive:
+            time.sleep(pause)
+        gpt.RETRY_COUNTS.clear()
+        with tempfile.TemporaryDirectory() as out, contextlib.redirect_stdout(io.StringIO()) as log:
+            start = time.perf_counter()
+            jobs = [(prompt, f"lesson{i}", out) for i, prompt in enumerate(prompts)]
+            results = asyncio.run(gpt.ask_many(jobs, concurrency, refresh=True, adaptive=adaptive))
+            elapsed = time.perf_counter() - start
+        summary = [line for line in log.getvalue().splitlines() if line.startswith("Concurrency:")]
+        print(f"{'adaptive' if adaptive else 'fixed':8}  {elapsed:8.2f}s  "
+              f"{sum(r is not None for r in results)}/{lessons} ok  "
+              f"{gpt.RETRY_COUNTS['rate_limit']} rate-limit retries  {' '.join(summary)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pipeline benchmarks")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    extract = sub.add_parser("extract", help="streaming extractor vs. full html5lib parse")
+    extract.add_argument("root", nargs="?", default=".")
+    extract.add_argument("--limit", type=int)
+
+    minify = sub.add_parser("minify", help="prompt size per minify level for one topic folder")
+    minify.add_argument("folder")
+
+    parallel = sub.add_parser("parallel", help="process-pool extraction scaling over the corpus")
+    parallel.add_argument("root", nargs="?", default=".")
+    parallel.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, os.cpu_count() or 1])
+
+    prompt_cache = sub.add_parser("prompt-cache", help="prompt prefix cache hits and latency saved per topic")
+    prompt_cache.add_argument("--log", help="usage log to read (default: gpt.USAGE_LOG_PATH)")
+
+    models = sub.add_parser("models", help="latency and cost per model from the usage log")
+    models.add_argument("--log", help="usage log to read (default: gpt.USAGE_LOG_PATH)")
+
+    startup = sub.add_parser("startup", help="import time of the library modules")
+    startup.add_argument("modules", nargs="*", default=["gpt", "batch"])
+    startup.add_argument("--runs", type=int, default=5)
+    startup.add_argument("--budget", type=float, default=0.5, help="seconds allowed over a bare interpreter")
+
+    concurrency = sub.add_parser("concurrency", help="fixed vs. adaptive concurrency against a (mock) API")
+    concurrency.add_argument("--lessons", type=int, default=40)
+    concurrency.add_argument("--concurrency", type=int, default=16)
+    concurrency.add_argument("--lesson-bytes", type=int, default=8000)
+    concurrency.add_argument("--pause", type=float, default=60, help="seconds between the two runs")
+
+    args = parser.parse_args()
+    if args.command == "extract":
+        bench_extract(args.root, args.limit)
+    elif args.command == "minify":
+        bench_minify(args.folder)
+    elif args.command == "parallel":
+        bench_parallel(args.root, args.workers)
+    elif args.command == "prompt-cache":
+        bench_prompt_cache(args.log)
+    elif args.command == "models":
+        bench_models(args.log)
+    elif args.command == "startup":
+        bench_startup(args.modules, args.runs, args.budget)
+    elif args.command == "concurrency":
+        bench_concurrency(args.lessons, args.concurrency, args.lesson_bytes, args.pause)
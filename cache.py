@@ -0,0 +1,97 @@
+import os
+import sqlite3
+import time
+
+CACHE_DIR = os.getenv("TTP_CACHE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache"))
+
+
+def connect(path):
+    """Open (creating its folder if needed) a SQLite database in WAL mode.
+
+    The connection may be used from any thread, e.g. the worker thread that
+    reads lessons in gpt.ask_many; callers that share it serialize access.
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    db = sqlite3.connect(path, timeout=30, check_same_thread=False)
+    db.execute("PRAGMA journal_mode=WAL")
+    return db
+
+
+class DiskCache:
+    """A small persistent key/value store on SQLite with size-bounded LRU eviction.
+
+    Values are strings. Every get() refreshes the entry's last-use time; once
+    the stored values exceed `max_bytes`, the least recently used entries are
+    dropped. Hit and miss counts are kept for the lifetime of the object.
+    """
+
+    def __init__(self, path, max_bytes):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._db = connect(path)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            " key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL, last_used REAL NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS entries_last_used ON entries (last_used)")
+        self._db.commit()
+
+    def get(self, key):
+        row = self._db.execute("SELECT value FROM entries WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        with self._db:
+            self._db.execute("UPDATE entries SET last_used = ? WHERE key = ?", (time.time(), key))
+        return row[0]
+
+    def __contains__(self, key):
+        """Whether `key` is stored; unlike get() this counts neither a hit nor a miss."""
+        return self._db.execute("SELECT 1 FROM entries WHERE key = ?", (key,)).fetchone() is not None
+
+    def put(self, key, value):
+        size = len(value.encode("utf-8"))
+        with self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO entries (key, value, size, last_used) VALUES (?, ?, ?, ?)",
+                (key, value, size, time.time()),
+            )
+            self._evict()
+
+    def _evict(self):
+        total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for key, size in self._db.execute("SELECT key, size FROM entries ORDER BY last_used").fetchall():
+            self._db.execute("DELETE FROM entries WHERE key = ?", (key,))
+            self.evictions += 1
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+    def delete(self, key):
+        with self._db:
+            self._db.execute("DELETE FROM entries WHERE key = ?", (key,))
+
+    def clear(self):
+        with self._db:
+            self._db.execute("DELETE FROM entries")
+
+    def stats(self):
+        entries, size = self._db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "entries": entries,
+            "bytes": size,
+        }
+
+    def close(self):
+        self._db.close()
@@ -0,0 +1,236 @@
+import json
+import re
+
+from bs4 import BeautifulSoup, Tag
+
+from clean import estimate_tokens
+
+HEADING_TAGS = {"h1", "h2", "h3", "h4", "h5", "h6"}
+# A question (worked example or exercise) is never split.
+QUESTION_CLASSES = {"example", "exercise"}
+# Lesson sub-headings are often plain short paragraphs.
+MAX_HEADING_CHARS = 80
+# A chunk may grow past its target to reach the next boundary, up to this factor.
+MAX_OVERSHOOT = 1.5
+
+FENCE_RE = re.compile(r"\A\s*```[a-z]*\n|\n```\s*\Z")
+IMPORT_RE = re.compile(r"^import\s[^;]*;[ \t]*\n?", re.M)
+METADATA_RE = re.compile(r"export const metadata[^=]*=\s*\{.*?\n\};?[ \t]*\n?", re.S)
+HEADER_RE = re.compile(r"<header\b.*?</header>", re.S)
+# A top-level declaration starts in column 0; its body is indented, up to the
+# closing brace or bracket back in column 0.
+DECLARATION_RE = re.compile(r"^(?:export\s+)?(?:async\s+)?(?:function|const|let|type|interface|enum|class)\s+"
+                            r"([A-Za-z_$][\w$]*)")
+IMPORT_NAMES_RE = re.compile(r"^import\s+(?:type\s+)?(.*?)\s+from\s", re.S)
+# A capitalized tag, but not a generic such as useRef<HTMLSpanElement>.
+COMPONENT_RE = re.compile(r"(?<![\w$])<([A-Z][\w$]*)[\s./>]")
+LOCAL_NAME_RE = re.compile(r"\b(?:const|let|var|function|class)\s+([A-Za-z_$][\w$]*)")
+DESTRUCTURE_RE = re.compile(r"\b(?:const|let|var)\s*\{([^}]*)\}")
+# A prop renamed to a component, as in ({ as: Tag = "span" }).
+RENAMED_PROP_RE = re.compile(r"\b[\w$]+\s*:\s*([A-Z][\w$]*)\s*=[^=>]")
+COMMENT_RE = re.compile(r"/\*.*?\*/|^\s*//.*$", re.S | re.M)
+
+
+def _size(tag):
+    return len(str(tag).encode("utf-8"))
+
+
+def _content_root(soup):
+    """The innermost element that still holds (nearly) the whole lesson."""
+    node = soup
+    total = _size(soup)
+    while True:
+        children = [child for child in node.children if isinstance(child, Tag)]
+        biggest = max(children, key=_size, default=None)
+        if biggest is None or _size(biggest) < 0.8 * total or biggest.name not in ("div", "section", "article"):
+            return node
+        if QUESTION_CLASSES.intersection(biggest.get("class", ())):
+            return node
+        node = biggest
+
+
+def _is_heading(tag):
+    if tag.name in HEADING_TAGS:
+        return True
+    if tag.name != "p" or tag.find(["img", "table"]) is not None:
+        return False
+    text = tag.get_text(" ", strip=True)
+    return (0 < len(text) <= MAX_HEADING_CHARS and text[0].isupper() and "$" not in text
+            and not text.endswith((".", ":", "?", "!", ",", ";", ")")))
+
+
+def _is_question(tag):
+    return tag.name == "div" and bool(QUESTION_CLASSES.intersection(tag.get("class", ())))
+
+
+def _is_must_know(tag):
+    return tag.name == "blockquote" and "must-know" in tag.get("class", ())
+
+
+def _surroundings(root):
+    """The nodes before and after `root` in the document, in document order.
+
+    Chapter and section titles often sit in wrappers outside the content root.
+    """
+    before, after = [], []
+    node = root
+    while node.parent is not None:
+        before[:0] = reversed(list(node.previous_siblings))
+        after += node.next_siblings
+        node = node.parent
+    return before, after
+
+
+def lesson_outline(html):
+    """Section headings of a cleaned lesson, in order."""
+    soup = BeautifulSoup(html, "html.parser")
+    root = _content_root(soup)
+    return [tag.get_text(" ", strip=True) for tag in soup.find_all(True)
+            if (tag.name in HEADING_TAGS or tag.parent is root and _is_heading(tag))
+            and tag.find_parent(_is_question) is None]
+
+
+def split_lesson(html, target_tokens):
+    """Split a cleaned lesson body into chunks of about `target_tokens` each.
+
+    Chunks end at semantic boundaries where possible: before a heading or a
+    question block, after a question block or a must-know box. Questions are
+    never cut in two. Returns a list of HTML strings; a lesson that is small
+    enough comes back as a single chunk.
+    """
+    if estimate_tokens(html) <= target_tokens * MAX_OVERSHOOT:
+        return [html]
+    soup = BeautifulSoup(html, "html.parser")
+    root = _content_root(soup)
+
+    before, after = _surroundings(root)
+    # Titles ahead of the content go into part 1, together with what follows them.
+    lead = "".join(str(node) for node in before)
+    units = [(lead, estimate_tokens(lead), True)] if lead.strip() else []  # (html, tokens, boundary before)
+    boundary = not units
+    for child in list(root.children) + after:
+        text = str(child)
+        if not isinstance(child, Tag):
+            if text.strip() and units:
+                units[-1] = (units[-1][0] + text, units[-1][1], units[-1][2])
+            continue
+        question = _is_question(child)
+        units.append((text, estimate_tokens(text), boundary or question or _is_heading(child)))
+        boundary = question or _is_must_know(child)
+
+    chunks, current, size = [], [], 0
+    for text, tokens, boundary in units:
+        over_target = size + tokens > target_tokens
+        if current and (over_target and boundary or size + tokens > target_tokens * MAX_OVERSHOOT):
+            chunks.append("".join(current))
+            current, size = [], 0
+        current.append(text)
+        size += tokens
+    if current:
+        # Fold a small tail into the chunk before it.
+        if chunks and size < target_tokens / 4:
+            chunks[-1] += "".join(current)
+        else:
+            chunks.append("".join(current))
+    return chunks
+
+
+def _split_declarations(text):
+    """Pull top-level declarations (helpers, types, constants) out of `text`.
+
+    Returns ({name: source}, the rest of the text).
+    """
+    declarations, rest, current = {}, [], None
+    for line in text.split("\n"):
+        if current is not None and (not line or line[0].isspace() or line[0] in "}])"):
+            current.append(line)
+            continue
+        match = DECLARATION_RE.match(line)
+        if match:
+            current = declarations.setdefault(match.group(1), [])
+            if current:
+                current = []  # declared twice in one part: keep the first
+            current.append(line)
+        else:
+            current = None
+            rest.append(line)
+    return {name: "\n".join(lines).strip() for name, lines in declarations.items()}, "\n".join(rest)
+
+
+def _parse_part(reply):
+    """Split a converted chunk into (imports, metadata, declarations, header, JSX body)."""
+    text = FENCE_RE.sub("", reply.strip())
+    imports = [line.strip() for line in IMPORT_RE.findall(text)]
+    text = IMPORT_RE.sub("", text)
+    metadata = METADATA_RE.search(text)
+    if metadata:
+        text = text[:metadata.start()] + text[metadata.end():]
+    declarations, text = _split_declarations(text)
+    text = text.strip()
+    if "<>" in text and "</>" in text:
+        text = text[text.index("<>") + 2:text.rindex("</>")]
+    header = HEADER_RE.search(text)
+    if header:
+        text = text[:header.start()] + text[header.end():]
+    return (imports, metadata.group().strip() if metadata else None, declarations,
+            header.group() if header else None, text.strip())
+
+
+def _names(bindings):
+    """Local names bound by an import clause or destructuring pattern, e.g. "A, { B as C }"."""
+    return re.findall(r"([A-Za-z_$][\w$]*)\s*(?=,|}|$)", bindings.strip())
+
+
+def undefined_components(page):
+    """JSX components `page` uses but neither imports nor declares anywhere."""
+    page = COMMENT_RE.sub("", page)
+    defined = set(LOCAL_NAME_RE.findall(page)) | set(RENAMED_PROP_RE.findall(page))
+    for bindings in DESTRUCTURE_RE.findall(page):
+        defined.update(_names(bindings))
+    for line in IMPORT_RE.findall(page):
+        clause = IMPORT_NAMES_RE.match(line.strip())
+        if clause:
+            defined.update(_names(clause.group(1)))
+    return sorted(set(COMPONENT_RE.findall(page)) - defined)
+
+
+def assemble_page(replies, title=""):
+    """Stitch converted chunks into one page with a single set of imports and metadata.
+
+    Every reply is expected to hold its import lines and one JSX fragment; the
+    first one with `export const metadata` (and a <header>) provides those for
+    the page. Top-level helpers and types from every part are kept, the first
+    definition of each name winning.
+    """
+    imports, metadata, declarations, header, bodies = [], None, {}, None, []
+    for reply in replies:
+        part_imports, part_metadata, part_declarations, part_header, body = _parse_part(reply)
+        imports += [line for line in part_imports if line not in imports]
+        metadata = metadata or part_metadata
+        for name, source in part_declarations.items():
+            declarations.setdefault(name, source)
+        header = header or part_header
+        bodies.append(body)
+
+    metadata_import = 'import type { Metadata } from "next";'
+    if metadata_import not in imports:
+        imports.insert(0, metadata_import)
+    if metadata is None:
+        metadata = f"export const metadata: Metadata = {{\n  title: {json.dumps(title)},\n}};"
+
+    body = "\n\n".join("        " + part.replace("\n", "\n        ") for part in bodies if part)
+    header = f"      {header}\n\n" if header else ""
+    helpers = "".join(source + "\n\n" for source in declarations.values())
+    return (
+        "\n".join(imports) + "\n\n" + metadata + "\n\n" + helpers +
+        "export default function Page() {\n"
+        "  return (\n"
+        '    <main className="mx-auto w-full max-w-4xl px-4 py-8 md:py-12">\n'
+        f"{header}"
+        '      <article className="space-y-6 text-gray-300">\n'
+        f"{body}\n"
+        "      </article>\n"
+        "    </main>\n"
+        "  );\n"
+        "}\n"
+    )
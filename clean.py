@@ -0,0 +1,266 @@
+import hashlib
+import os
+import re
+from dataclasses import dataclass, field
+
+from bs4 import BeautifulSoup, Comment, NavigableString
+
+from mathjax import replace_mathjax
+
+# Minification levels, each one including everything the previous one does:
+#   none      leave the markup as is
+#   data      drop data-*/style/event attributes, comments and widget debris
+#             (bookmark flags, icons, radio inputs, answer/solution toggles)
+#   attrs     also drop ids and presentational classes, unwrap bare spans and
+#             collapse whitespace
+#   semantic  keep only content tags (p, blockquote.must-know, lists, tables,
+#             headings, strong/em, ...) and unwrap everything else
+MINIFY_LEVELS = ("none", "data", "attrs", "semantic")
+# Bump whenever cleaning changes its output for the same rules and level.
+CLEAN_VERSION = "3"
+MINIFY_LEVEL = os.getenv("MINIFY_LEVEL", "attrs")
+
+
+@dataclass
+class StripRule:
+    """Removes every subtree matching `selector` that is at least `min_bytes` long.
+
+    When `max_text_ratio` is set, a match is only removed if its visible text is
+    at most that fraction of its markup, i.e. it is mostly tags and attributes.
+    """
+    name: str
+    selector: str
+    min_bytes: int = 0
+    max_text_ratio: float = None
+
+
+@dataclass
+class CleanReport:
+    bytes_before: int = 0
+    bytes_after: int = 0
+    formulas: int = 0
+    removed: dict = field(default_factory=dict)  # rule or stage name -> bytes removed
+
+    @property
+    def bytes_removed(self):
+        return self.bytes_before - self.bytes_after
+
+    @property
+    def tokens_removed(self):
+        return estimate_tokens_from_bytes(self.bytes_removed)
+
+
+# Rules run in registration order. Register, replace or delete entries here to
+# change what the cleaning stage strips.
+STRIP_RULES = {}
+
+
+def register_rule(name, selector, min_bytes=0, max_text_ratio=None):
+    STRIP_RULES[name] = StripRule(name, selector, min_bytes, max_text_ratio)
+
+
+register_rule("scripts", 'script:not([type^="math/"]), noscript, style, link, iframe')
+register_rule("userway", 'div.uw-sl, .uwy, [class*="userway"], [class^="uw-s"], [class*=" uw-s"]')
+register_rule("loading-overlays", '#loading-overlay, #loading-overlay-dark, .loader-box, .offline-ui, '
+                                  '[class*="-loader"], .note-overlay')
+register_rule("welcome-ondemand", "#welcome-ondemand-screen")
+# Grouped-exercise modals hold the lesson's own worked examples (VARC, multi-source
+# and table-analysis questions), so they stay.
+register_rule("modals", ".modal:not(.grouped-exercise-modal), .flashcard-lesson-modal, .summarize-lesson-modal, "
+                        ".chat-feedback-modals")
+# Only the toolbox: the wrapper around it also holds the example's <h3>Example N</h3>.
+register_rule("ai-assist", ".ai-assist-toolbox, .ai-toolbox-btn, .ai-assist-tutor-content, .ttp-assist-wrapper, "
+                           ".lesson-sidebar-chat-ai, .render-ai-example")
+register_rule("chat-widgets", '.chat-img, #intercom-custom-modal, [class*="intercom-"]')
+# "PRESENTED BY" and the instructor's photo, name and title, twice over.
+register_rule("instructor-bio", ".instructors")
+register_rule("lesson-feedback", ".lesson-feedback-wrapper, .new_lesson_feedback, .summary-box")
+register_rule("sidebar", ".lesson-sidebar, .lesson-nav, .mobile-navigation")
+# Anything left that is big but carries almost no text is layout or icon markup.
+register_rule("markup-only", "div:not(:has(img, svg, table, .MathJax)), section, form, aside",
+              min_bytes=4096, max_text_ratio=0.01)
+
+
+def clean_signature(rules=None, minify_level=None, math=True):
+    """Short string identifying a cleaning configuration, for cache keys."""
+    selected = STRIP_RULES.values() if rules is None else [STRIP_RULES[name] for name in rules]
+    rules_hash = hashlib.sha256(repr(list(selected)).encode("utf-8")).hexdigest()[:12]
+    return f"{CLEAN_VERSION}:{minify_level or MINIFY_LEVEL}:{int(math)}:{rules_hash}"
+
+
+def estimate_tokens_from_bytes(n_bytes):
+    """Rough token count for HTML: about four bytes per token."""
+    return (n_bytes + 3) // 4
+
+
+def estimate_tokens(text):
+    return estimate_tokens_from_bytes(len(text.encode("utf-8")))
+
+
+def _byte_len(tag):
+    return len(str(tag).encode("utf-8"))
+
+
+def _strip(soup, rules, report):
+    selected = STRIP_RULES.values() if rules is None else [STRIP_RULES[name] for name in rules]
+    for rule in selected:
+        removed = 0
+        for tag in soup.select(rule.selector):
+            # Already gone with an ancestor matched earlier by this rule.
+            if tag.decomposed:
+                continue
+            size = _byte_len(tag)
+            if size < rule.min_bytes:
+                continue
+            if rule.max_text_ratio is not None:
+                text_size = len(tag.get_text().strip().encode("utf-8"))
+                if text_size > size * rule.max_text_ratio:
+                    continue
+            tag.decompose()
+            removed += size
+        if removed:
+            report.removed[rule.name] = removed
+
+
+def strip_boilerplate(html, rules=None):
+    """Remove site chrome from a lesson body.
+
+    `rules` is an iterable of rule names from STRIP_RULES; all registered rules
+    run when it is None. Returns the cleaned HTML and a CleanReport.
+    """
+    return clean_lesson_body(html, rules=rules, minify_level="none", math=False)
+
+
+# Interactive widget pieces inside the lesson that carry no content.
+WIDGET_SELECTOR = ('.flags, .exercise-correctness-bar, .confirm-answer, .see-solution, '
+                   '.visually-hidden, .radio-style, input, i[class*="fa-"]')
+
+# Attributes that matter for conversion; every other data-* attribute goes.
+KEEP_DATA_ATTRS = {"data-correct-option"}
+DROP_ATTRS = {"style", "onclick", "onload", "tabindex"}
+
+# Classes that describe content rather than presentation.
+KEEP_CLASSES = {"must-know", "example", "exercise", "answer", "option", "solution-wrapper",
+                "solution-title", "indented1", "indented2", "indented3"}
+KEEP_ATTRS = {"href", "src", "alt", "colspan", "rowspan", "type", "class", "data-correct-option"}
+
+SEMANTIC_TAGS = {"p", "br", "blockquote", "ul", "ol", "li", "table", "thead", "tbody", "tfoot",
+                 "tr", "th", "td", "strong", "em", "b", "i", "u", "sub", "sup",
+                 "h1", "h2", "h3", "h4", "h5", "h6", "img"}
+# Outside SEMANTIC_TAGS, a div survives the semantic level only with one of these.
+SEMANTIC_BLOCK_CLASSES = {"example", "answer", "solution-wrapper"}
+# Kept verbatim (after attribute stripping) at the semantic level.
+OPAQUE_TAGS = {"svg", "math", "pre", "script"}
+VOID_TAGS = {"br", "hr", "img", "input", "col", "source", "wbr"}
+
+WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _minify(soup, level):
+    rank = MINIFY_LEVELS.index(level)
+    if rank == 0:
+        return
+
+    for comment in soup.find_all(string=lambda text: isinstance(text, Comment)):
+        comment.extract()
+    for tag in soup.select(WIDGET_SELECTOR):
+        if not tag.decomposed:
+            tag.decompose()
+
+    for tag in soup.find_all(True):
+        # Inside svg/math every remaining attribute is needed to render it.
+        opaque = rank >= 2 and (tag.name in OPAQUE_TAGS or tag.find_parent(OPAQUE_TAGS) is not None)
+        for name in list(tag.attrs):
+            if name in DROP_ATTRS or (name.startswith("data-") and name not in KEEP_DATA_ATTRS):
+                del tag[name]
+            elif rank < 2 or opaque:
+                continue
+            elif name == "class":
+                classes = [cls for cls in tag["class"] if cls in KEEP_CLASSES]
+                if classes:
+                    tag["class"] = classes
+                else:
+                    del tag["class"]
+            elif name not in KEEP_ATTRS:
+                del tag[name]
+
+    if rank >= 2:
+        for tag in soup.find_all(True):
+            if tag.decomposed or tag.name in VOID_TAGS or tag.attrs:
+                continue
+            if tag.name == "span":
+                tag.unwrap()
+            elif not tag.get_text().strip() and tag.find(VOID_TAGS | OPAQUE_TAGS) is None:
+                tag.decompose()
+        for text in soup.find_all(string=True):
+            if text.find_parent(["pre", "textarea"]) is not None:
+                continue
+            collapsed = WHITESPACE_RE.sub(" ", text)
+            if collapsed == " " and "\n" in text:
+                text.extract()
+            elif collapsed != text:
+                text.replace_with(NavigableString(collapsed))
+
+    if rank >= 3:
+        for tag in soup.find_all(True):
+            if tag.decomposed or tag.find_parent(OPAQUE_TAGS) is not None:
+                continue
+            if tag.name in OPAQUE_TAGS or tag.name in SEMANTIC_TAGS:
+                continue
+            if tag.name == "div" and SEMANTIC_BLOCK_CLASSES.intersection(tag.get("class", ())):
+                continue
+            tag.unwrap()
+        for tag in soup.find_all(class_=True):
+            if tag.name == "blockquote":
+                tag["class"] = [cls for cls in tag["class"] if cls == "must-know"] or None
+            elif tag.name != "div":
+                del tag["class"]
+
+
+def clean_lesson_body(html, rules=None, minify_level=None, math=True):
+    """Strip boilerplate, rewrite math and minify a lesson body in a single parse.
+
+    With `math`, rendered MathJax is replaced by inline TeX (see
+    mathjax.replace_mathjax). `minify_level` is one of MINIFY_LEVELS and defaults to MINIFY_LEVEL (the
+    MINIFY_LEVEL environment variable). The output depends only on the input
+    and the level, so it is byte-for-byte reproducible.
+    """
+    level = minify_level or MINIFY_LEVEL
+    if level not in MINIFY_LEVELS:
+        raise ValueError(f"Unknown minify level '{level}', expected one of {MINIFY_LEVELS}")
+
+    report = CleanReport(bytes_before=len(html.encode("utf-8")))
+    soup = BeautifulSoup(html, "html.parser")
+    _strip(soup, rules, report)
+    if math:
+        report.formulas, saved = replace_mathjax(soup)
+        if saved:
+            report.removed["mathjax"] = saved
+    _minify(soup, level)
+
+    cleaned = str(soup)
+    report.bytes_after = len(cleaned.encode("utf-8"))
+    minified = report.bytes_removed - sum(report.removed.values())
+    if minified and level != "none":
+        report.removed["minify"] = minified
+    return cleaned, report
+
+
+def minify(html, level=None):
+    """Minify a lesson body without stripping boilerplate."""
+    return clean_lesson_body(html, rules=(), minify_level=level, math=False)[0]
+
+
+def minify_report(html):
+    """Minify `html` at every level.
+
+    Returns {level: (output, tokens, token_delta)} where token_delta is the
+    estimated saving against the unminified input.
+    """
+    base = estimate_tokens(html)
+    report = {}
+    for level in MINIFY_LEVELS:
+        output = minify(html, level)
+        tokens = estimate_tokens(output)
+        report[level] = (output, tokens, base - tokens)
+    return report
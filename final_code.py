@@ -1,17 +1,140 @@
-from gpt import ask
-from test import extract_body_from_html_files
+import argparse
+import collections
+import glob
+import hashlib
+import os
 
+from batch import run_batch
+from gpt import CONCURRENCY, FALLBACK_MODEL, ask_all, plan_report, prompt_version, route
+from lesson_ids import LessonIds
+from manifest import Manifest
+from test import extractor_version, iter_folders_lessons, natural_sort_key, page_fingerprint
 
-file_paths = [
-    "/Users/joysinha/Desktop/Algo/Quant2",
-]
 
+def topic_folders(patterns):
+    """Expand topic folder paths and globs into folders with ttp*.html pages, in order and without repeats."""
+    folders = []
+    for pattern in patterns:
+        # A glob also matches files and folders like prompts/ that are not topics; only named paths warn.
+        named = not glob.has_magic(pattern)
+        matches = [pattern] if named else sorted(glob.glob(pattern), key=natural_sort_key)
+        for path in matches:
+            path = os.path.abspath(path)
+            if not os.path.isdir(path):
+                if named:
+                    print(f"⚠ {path} is not a folder, skipped")
+            elif not glob.glob(os.path.join(glob.escape(path), "ttp*.html")):
+                if named:
+                    print(f"⚠ {path} has no ttp*.html pages, skipped")
+            elif path not in folders:
+                folders.append(path)
+    return folders
 
 
-for file_path in file_paths:
-    body_list = extract_body_from_html_files(file_path)
-    count = 0
-    for body in body_list:
-        file_name = f"lesson{count}"
-        ask(body, file_name, file_path)
-        count += 1
+def batch_name(folders):
+    """Batch state is kept per name, so the same set of topics resumes the same batch."""
+    if len(folders) == 1:
+        return os.path.basename(folders[0])
+    return "course-" + hashlib.sha256("\n".join(folders).encode("utf-8")).hexdigest()[:12]
+
+
+def lesson_inputs(source_path, body):
+    """Fingerprints of everything a lesson's output is built from."""
+    return {
+        "source": page_fingerprint(source_path),
+        "extractor": extractor_version(),
+        "prompt": prompt_version(),
+        "model": route(body)[0],
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Convert TTP topic folders into Next.js lesson pages")
+    parser.add_argument("topics", nargs="+", help="topic folders or globs, e.g. 'Algo/*'")
+    parser.add_argument("--refresh", action="store_true",
+                        help="re-convert every lesson instead of reusing cached completions")
+    parser.add_argument("--batch", action="store_true", help="submit everything through the Batch API")
+    parser.add_argument("--plan", action="store_true",
+                        help="only print the predicted tokens, cost and time; send nothing")
+    parser.add_argument("--pack", action="store_true", help="send small lessons several to a request")
+    parser.add_argument("--dry-run", action="store_true", help="list the lessons that would rebuild, and why")
+    parser.add_argument("--concurrency", type=int, default=CONCURRENCY,
+                        help="requests in flight across all topics")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="extraction processes shared by all topics (default: CPU count)")
+    args = parser.parse_args(argv)
+
+    folders = topic_folders(args.topics)
+    if not folders:
+        parser.error("no topic folders matched")
+    manifest = Manifest()
+    counts = collections.Counter()
+    for folder in folders:
+        counts.update(manifest.counts(os.path.basename(folder)))
+    if counts:
+        print(f"Manifest: {counts.get('done', 0)} done, {counts.get('failed', 0)} failed, "
+              f"{counts.get('running', 0)} interrupted")
+
+    # A dry run works out lesson ids without saving them, so it changes nothing.
+    lesson_ids = LessonIds(read_only=True) if args.dry_run else None
+    lessons = iter_folders_lessons(folders, workers=args.workers, lesson_ids=lesson_ids)
+    sources = []  # (topic, source file, inputs) of each job, in job order
+
+    def pending_jobs():
+        """Jobs for every stale lesson, each marked as started in the manifest.
+
+        A lesson is stale if it never finished or anything it was built from
+        changed since: its source page, the extractor, the prompt or the model.
+        """
+        up_to_date = 0
+        for folder, source_path, lesson_id, body in lessons:
+            topic, source = os.path.basename(folder), os.path.basename(source_path)
+            output = os.path.join(folder, f"{lesson_id}.tsx")
+            inputs = lesson_inputs(source_path, body)
+            reasons = ["--refresh"] if args.refresh else manifest.check(topic, source, output, inputs)
+            if not reasons:
+                up_to_date += 1
+                continue
+            sources.append((topic, source, inputs))
+            if args.dry_run:
+                print(f"→ {topic}/{lesson_id}.tsx ({source}): {', '.join(reasons)}")
+                continue
+            if not args.plan:
+                manifest.start(topic, source, lesson_id, output, inputs)
+            yield body, lesson_id, folder
+        if up_to_date:
+            print(f"↷ {up_to_date} lessons up to date, skipped")
+
+    def on_done(index, content, error, stats):
+        topic, source, inputs = sources[index]
+        # A lesson the fallback model converted is rebuilt once its own model is back.
+        if stats["fallback"]:
+            inputs = {**inputs, "model": FALLBACK_MODEL}
+        # The lessons of a packed request share one stats dict, so it is read, not popped.
+        spent = {key: value for key, value in stats.items() if key != "fallback"}
+        manifest.finish(topic, source, content, error, inputs=inputs if stats["fallback"] else None, **spent)
+
+    # Lessons are extracted while earlier ones are converting, unless the
+    # whole list is needed up front.
+    jobs = pending_jobs()
+    if args.plan or args.batch or args.pack or args.dry_run:
+        jobs = list(jobs)
+
+    if args.dry_run:
+        print(f"{len(sources)} lessons would rebuild")
+    elif args.plan:
+        plan_report(jobs, args.concurrency)
+    elif args.batch:
+        written = run_batch(jobs, batch_name(folders), refresh=args.refresh)
+        for (topic, source, _), (_, lesson_id, folder) in zip(sources, jobs):
+            content = written.get((folder, lesson_id))
+            manifest.finish(topic, source, content, None if content is not None else "failed or cut off in the batch")
+    else:
+        results = ask_all(jobs, args.concurrency, refresh=args.refresh, pack=args.pack, on_done=on_done)
+        converted = sum(result is not None for result in results)
+        mark = "✓" if converted == len(results) else "⚠"
+        print(f"{mark} {converted}/{len(results)} lessons converted across {len(folders)} topics")
+
+
+if __name__ == "__main__":
+    main()
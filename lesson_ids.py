@@ -0,0 +1,115 @@
+import itertools
+import os
+import re
+import sqlite3
+import threading
+from pathlib import Path
+
+from cache import CACHE_DIR, connect
+
+LESSON_IDS_PATH = os.path.join(CACHE_DIR, "lesson_ids.sqlite")
+
+TTP_RE = re.compile(r"^ttp(\d+)\.html?$", re.I)
+
+
+def derived_id(source, fingerprint):
+    """The id a new page gets: lessonN-1 for ttpN.html, otherwise one from its content.
+
+    ttp pages are numbered from 1 and lessons from 0, so a topic without gaps
+    keeps the names it had when lessons were simply counted.
+    """
+    match = TTP_RE.match(source)
+    if match and int(match.group(1)) > 0:
+        return f"lesson{int(match.group(1)) - 1}"
+    return f"lesson-{fingerprint[:12]}"
+
+
+def _topic(folder_path):
+    return os.path.basename(os.path.normpath(folder_path))
+
+
+class LessonIds:
+    """Persisted lesson ids, one per (topic folder, source file).
+
+    A page keeps the id it was first given however the folder changes
+    around it: pages that fail to parse, are added or are removed don't shift
+    anyone else's output. A page renamed with unchanged content (same
+    fingerprint) keeps its id too. Ids are unique within a topic.
+
+    A topic converted before ids were kept has lessonN.tsx outputs numbered
+    in extraction order; the first full pass over it records those numbers
+    (see `legacy_id`) and only pages added later get derived ids.
+
+    With `read_only`, the table is worked on in an in-memory copy: ids come
+    out as a real run would assign them, but nothing is saved.
+    """
+
+    def __init__(self, path=LESSON_IDS_PATH, read_only=False):
+        self.path = path
+        self._lock = threading.Lock()
+        if read_only:
+            self._db = sqlite3.connect(":memory:", check_same_thread=False)
+            if os.path.exists(path):
+                saved = sqlite3.connect(Path(path).resolve().as_uri() + "?mode=ro", uri=True)
+                saved.backup(self._db)
+                saved.close()
+        else:
+            self._db = connect(path)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS lesson_ids ("
+            " topic TEXT NOT NULL, source TEXT NOT NULL, fingerprint TEXT, lesson_id TEXT NOT NULL,"
+            " PRIMARY KEY (topic, source), UNIQUE (topic, lesson_id))"
+        )
+        # Topics every page of which has been given an id at least once.
+        self._db.execute("CREATE TABLE IF NOT EXISTS seeded_topics (topic TEXT PRIMARY KEY)")
+        self._db.commit()
+
+    def seeded(self, folder_path):
+        with self._lock:
+            return self._db.execute("SELECT 1 FROM seeded_topics WHERE topic = ?",
+                                    (_topic(folder_path),)).fetchone() is not None
+
+    def mark_seeded(self, folder_path):
+        with self._lock, self._db:
+            self._db.execute("INSERT OR IGNORE INTO seeded_topics (topic) VALUES (?)", (_topic(folder_path),))
+
+    def assign(self, folder_path, source, fingerprint, legacy_id=None):
+        """The id of `source` in `folder_path`, given a new one on first sight.
+
+        A new page takes `legacy_id`, the name its output already has, if
+        given and still free.
+        """
+        topic = _topic(folder_path)
+        with self._lock, self._db:
+            row = self._db.execute("SELECT lesson_id, fingerprint FROM lesson_ids WHERE topic = ? AND source = ?",
+                                   (topic, source)).fetchone()
+            if row is not None:
+                if row[1] != fingerprint:
+                    self._db.execute("UPDATE lesson_ids SET fingerprint = ? WHERE topic = ? AND source = ?",
+                                     (fingerprint, topic, source))
+                return row[0]
+
+            # A renamed page: same content, and its old file is gone.
+            for old_source, lesson_id in self._db.execute(
+                    "SELECT source, lesson_id FROM lesson_ids WHERE topic = ? AND fingerprint = ?",
+                    (topic, fingerprint)).fetchall():
+                if not os.path.exists(os.path.join(folder_path, old_source)):
+                    self._db.execute("UPDATE lesson_ids SET source = ? WHERE topic = ? AND source = ?",
+                                     (source, topic, old_source))
+                    return lesson_id
+
+            # If the derived id is taken (say ttp5.html was replaced by a new
+            # page), fall back to the content, then to numbered variants of it.
+            candidates = itertools.chain([legacy_id] if legacy_id else [],
+                                         [derived_id(source, fingerprint), f"lesson-{fingerprint[:12]}"],
+                                         (f"lesson-{fingerprint[:12]}-{n}" for n in itertools.count(2)))
+            for lesson_id in candidates:
+                if self._db.execute("SELECT 1 FROM lesson_ids WHERE topic = ? AND lesson_id = ?",
+                                    (topic, lesson_id)).fetchone() is None:
+                    break
+            self._db.execute("INSERT INTO lesson_ids (topic, source, fingerprint, lesson_id) VALUES (?, ?, ?, ?)",
+                             (topic, source, fingerprint, lesson_id))
+            return lesson_id
+
+    def close(self):
+        self._db.close()
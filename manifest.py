@@ -0,0 +1,116 @@
+import hashlib
+import json
+import os
+import threading
+import time
+
+from cache import CACHE_DIR, connect
+
+MANIFEST_PATH = os.path.join(CACHE_DIR, "manifest.sqlite")
+
+
+def content_hash(content):
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+class Manifest:
+    """Every lesson conversion ever started, one row per (topic, source file).
+
+    A job is "running" from the moment it is handed out until it is "done" or
+    "failed"; one still running when a run starts was interrupted. Rows also
+    hold how many attempts the job took, the hash of the output written and
+    the tokens and seconds spent on it. Each change is committed on its own,
+    so the manifest is accurate up to the moment a run stops, however it stops.
+
+    Each row also records the inputs its output was built from (source hash,
+    extractor, prompt and model versions), so check() can tell, make-style,
+    whether the output is stale.
+    """
+
+    def __init__(self, path=MANIFEST_PATH):
+        self.path = path
+        # Jobs are handed out from a worker thread and finished on the event loop.
+        self._lock = threading.Lock()
+        self._db = connect(path)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            " topic TEXT NOT NULL, source TEXT NOT NULL, lesson_id TEXT NOT NULL, output TEXT NOT NULL,"
+            " state TEXT NOT NULL, attempts INTEGER NOT NULL DEFAULT 0, output_hash TEXT, error TEXT,"
+            " prompt_tokens INTEGER, completion_tokens INTEGER, latency REAL, updated REAL NOT NULL,"
+            " PRIMARY KEY (topic, source))"
+        )
+        columns = {row[1] for row in self._db.execute("PRAGMA table_info(jobs)")}
+        if "inputs" not in columns:
+            self._db.execute("ALTER TABLE jobs ADD COLUMN inputs TEXT")
+        self._db.commit()
+
+    def get(self, topic, source):
+        with self._lock:
+            row = self._db.execute(
+                "SELECT lesson_id, output, state, attempts, output_hash, error, inputs FROM jobs"
+                " WHERE topic = ? AND source = ?",
+                (topic, source),
+            ).fetchone()
+        if row is None:
+            return None
+        job = dict(zip(("lesson_id", "output", "state", "attempts", "output_hash", "error", "inputs"), row))
+        job["inputs"] = json.loads(job["inputs"]) if job["inputs"] else None
+        return job
+
+    def check(self, topic, source, output, inputs):
+        """Why `output` needs (re)building from `inputs`; an empty list if it is up to date."""
+        job = self.get(topic, source)
+        if job is None:
+            return ["new"]
+        if job["state"] != "done":
+            return ["interrupted" if job["state"] == "running" else "failed last time"]
+        if job["output"] != output:
+            return ["output moved"]
+        try:
+            with open(output, "r", encoding="utf-8") as f:
+                if content_hash(f.read()) != job["output_hash"]:
+                    return ["output edited"]
+        except FileNotFoundError:
+            return ["output missing"]
+        if job["inputs"] is None:
+            return ["inputs unknown"]
+        return [f"{name} changed" for name, value in inputs.items() if job["inputs"].get(name) != value]
+
+    def start(self, topic, source, lesson_id, output, inputs=None):
+        """Mark a job as running, built from `inputs` ({name: fingerprint})."""
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT INTO jobs (topic, source, lesson_id, output, state, attempts, inputs, updated)"
+                " VALUES (?, ?, ?, ?, 'running', 1, ?, ?)"
+                " ON CONFLICT (topic, source) DO UPDATE SET lesson_id = excluded.lesson_id,"
+                " output = excluded.output, state = 'running', attempts = attempts + 1, error = NULL,"
+                " inputs = excluded.inputs, updated = excluded.updated",
+                (topic, source, lesson_id, output, json.dumps(inputs, sort_keys=True) if inputs else None,
+                 time.time()),
+            )
+
+    def finish(self, topic, source, content=None, error=None, prompt_tokens=None, completion_tokens=None,
+               latency=None, inputs=None):
+        """Record a job's outcome: done with `content`, or failed with `error`.
+
+        `inputs` replaces the ones given to start(), e.g. when the output
+        ended up built by another model.
+        """
+        state = "done" if content is not None else "failed"
+        with self._lock, self._db:
+            self._db.execute(
+                "UPDATE jobs SET state = ?, output_hash = ?, error = ?, prompt_tokens = ?, completion_tokens = ?,"
+                " latency = ?, inputs = COALESCE(?, inputs), updated = ? WHERE topic = ? AND source = ?",
+                (state, content_hash(content) if content is not None else None, error, prompt_tokens,
+                 completion_tokens, latency, json.dumps(inputs, sort_keys=True) if inputs else None, time.time(),
+                 topic, source),
+            )
+
+    def counts(self, topic=None):
+        """{state: jobs} over every topic, or just `topic`."""
+        query = "SELECT state, COUNT(*) FROM jobs" + (" WHERE topic = ?" if topic else "") + " GROUP BY state"
+        with self._lock:
+            return dict(self._db.execute(query, (topic,) if topic else ()).fetchall())
+
+    def close(self):
+        self._db.close()
@@ -0,0 +1,247 @@
+import re
+
+from bs4 import BeautifulSoup, NavigableString, Tag
+
+# Glyphs MathJax and the MathML sources use, mapped to TeX. Anything not listed
+# is passed through as is.
+GLYPHS = {
+    "−": "-", "–": "-", "—": "-", "×": r"\times", "÷": r"\div", "⋅": r"\cdot", "·": r"\cdot",
+    "±": r"\pm", "∓": r"\mp", "≤": r"\le", "≥": r"\ge", "≠": r"\ne", "≈": r"\approx",
+    "<": r"\lt", ">": r"\gt", "⇒": r"\Rightarrow", "⇐": r"\Leftarrow", "⇔": r"\Leftrightarrow",
+    "→": r"\to", "←": r"\leftarrow", "↔": r"\leftrightarrow", "∞": r"\infty", "⋯": r"\cdots",
+    "…": r"\ldots", "‣": r"\triangleright", "√": r"\surd", "∠": r"\angle", "°": r"^\circ",
+    "△": r"\triangle", "∥": r"\parallel", "⊥": r"\perp", "∈": r"\in", "∉": r"\notin",
+    "∪": r"\cup", "∩": r"\cap", "⊂": r"\subset", "∅": r"\emptyset", "∴": r"\therefore",
+    "%": r"\%", "$": r"\$", "#": r"\#", "&": r"\&", "_": r"\_", "{": r"\{", "}": r"\}",
+    "π": r"\pi", "θ": r"\theta", "α": r"\alpha", "β": r"\beta", "γ": r"\gamma", "δ": r"\delta",
+    "Δ": r"\Delta", "λ": r"\lambda", "μ": r"\mu", "σ": r"\sigma", "Σ": r"\Sigma", "ρ": r"\rho",
+    "ω": r"\omega", "Ω": r"\Omega", "φ": r"\phi", "ε": r"\varepsilon", "²": "^2", "³": "^3",
+    " ": " ",
+}
+
+FUNCTIONS = {"sin", "cos", "tan", "log", "ln", "exp", "max", "min", "lim", "mod", "gcd"}
+
+# Accents that sit over a base in <mover>.
+OVER_ACCENTS = {"¯": r"\overline", "―": r"\overline", "‾": r"\overline", "^": r"\hat",
+                "→": r"\overrightarrow", "⏜": r"\overgroup", "˙": r"\dot"}
+
+ENCLOSURES = {"box": r"\boxed", "roundedbox": r"\boxed", "updiagonalstrike": r"\cancel",
+              "downdiagonalstrike": r"\bcancel", "horizontalstrike": r"\sout",
+              "top": r"\overline", "bottom": r"\underline"}
+
+# Characters that still need escaping inside \text{...}.
+TEXT_ESCAPES = {char: GLYPHS[char] for char in "%$#&_{}"}
+
+WHITESPACE_RE = re.compile(r"\s+")
+PLAIN_TEXT_RE = re.compile(r"[\d\s.,!=+()\[\]/:×−–-]+")
+
+
+def _glyphs(text):
+    return "".join(GLYPHS.get(char, char) for char in text)
+
+
+def _text(text):
+    return r"\text{" + "".join(TEXT_ESCAPES.get(char, char) for char in text) + "}"
+
+
+def _group(tex):
+    """Brace a sub/superscript argument unless it is a single character."""
+    return tex if len(tex) == 1 else "{" + tex + "}"
+
+
+def _children(tag):
+    return [child for child in tag.children if isinstance(child, Tag)]
+
+
+def _join(parts):
+    # Keep control words like \times from running into a following letter.
+    out = ""
+    for part in parts:
+        if out and part and re.search(r"\\[a-zA-Z]+$", out) and part[0].isalpha():
+            out += " "
+        out += part
+    return out
+
+
+def _row(tag):
+    return _join(_tex(child) for child in _children(tag))
+
+
+def _tex(tag):
+    name = tag.name
+    args = _children(tag)
+
+    if name in ("mi", "mn", "mo"):
+        text = WHITESPACE_RE.sub(" ", tag.get_text()).strip()
+        if name == "mi" and text in FUNCTIONS:
+            return "\\" + text
+        if name == "mi" and len(text) > 1 and text.isalpha():
+            return _text(text)
+        if tag.get("mathvariant") == "bold":
+            return r"\mathbf{" + _glyphs(text) + "}"
+        return _glyphs(text)
+    if name == "mtext":
+        text = WHITESPACE_RE.sub(" ", tag.get_text().replace(" ", " "))
+        if not text.strip():
+            return r"\ " if text else ""
+        if PLAIN_TEXT_RE.fullmatch(text):
+            # Digits and operators read the same outside \text{...}.
+            return _glyphs(text.strip())
+        return _text(text)
+    if name == "mspace":
+        if tag.get("linebreak") == "newline":
+            return r"\\ "
+        width = re.match(r"[\d.]+", tag.get("width", ""))
+        return r"\quad " if width and float(width.group()) >= 16 else r"\ "
+    if name == "none":
+        return ""
+    if name == "semantics":
+        return _tex(args[0]) if args else ""
+    if name == "mfrac":
+        if len(args) != 2:
+            return _row(tag)
+        return r"\frac{" + _tex(args[0]) + "}{" + _tex(args[1]) + "}"
+    if name == "msup" and len(args) == 2:
+        return _group(_tex(args[0])) + "^" + _group(_tex(args[1]))
+    if name == "msub" and len(args) == 2:
+        return _group(_tex(args[0])) + "_" + _group(_tex(args[1]))
+    if name == "msubsup" and len(args) == 3:
+        return _group(_tex(args[0])) + "_" + _group(_tex(args[1])) + "^" + _group(_tex(args[2]))
+    if name == "msqrt":
+        return r"\sqrt{" + _row(tag) + "}"
+    if name == "mroot" and len(args) == 2:
+        return r"\sqrt[" + _tex(args[1]) + "]{" + _tex(args[0]) + "}"
+    if name == "mfenced":
+        open_, close = tag.get("open", "("), tag.get("close", ")")
+        separator = (tag.get("separators", ",").strip() or " ")[0] if tag.has_attr("separators") else ","
+        inner = separator.join(_tex(child) for child in args)
+        return _glyphs(open_) + inner + _glyphs(close)
+    if name == "menclose":
+        inner = _row(tag)
+        notations = tag.get("notation", "").split()
+        if {"updiagonalstrike", "downdiagonalstrike"} <= set(notations):
+            return r"\xcancel{" + inner + "}"
+        for notation in notations:
+            if notation == "longdiv":
+                return r"\overline{)" + inner + "}"
+            if notation in ENCLOSURES:
+                inner = ENCLOSURES[notation] + "{" + inner + "}"
+        return inner
+    if name == "mover" and len(args) == 2:
+        accent = args[1].get_text().strip()
+        if accent in OVER_ACCENTS:
+            return OVER_ACCENTS[accent] + "{" + _tex(args[0]) + "}"
+        return r"\overset{" + _tex(args[1]) + "}{" + _tex(args[0]) + "}"
+    if name == "munder" and len(args) == 2:
+        if args[1].get_text().strip() in ("_", "‾", "¯", "―"):
+            return r"\underline{" + _tex(args[0]) + "}"
+        return r"\underset{" + _tex(args[1]) + "}{" + _tex(args[0]) + "}"
+    if name == "munderover" and len(args) == 3:
+        return _group(_tex(args[0])) + "_" + _group(_tex(args[1])) + "^" + _group(_tex(args[2]))
+    if name == "mmultiscripts":
+        return _multiscripts(args)
+    if name == "mphantom":
+        return r"\phantom{" + _row(tag) + "}"
+    if name == "mtable":
+        rows = [[_row(cell) for cell in _children(row)] for row in args]
+        columns = max((len(row) for row in rows), default=1)
+        body = r" \\ ".join(" & ".join(row) for row in rows)
+        return r"\begin{array}{" + "l" * columns + "}" + body + r"\end{array}"
+    # math, mrow, mstyle, mpadded, mtd and anything unknown: just the contents.
+    return _row(tag)
+
+
+def _multiscripts(args):
+    base, scripts = (_tex(args[0]) if args else ""), args[1:]
+    post, pre = scripts, []
+    for i, child in enumerate(scripts):
+        if child.name == "mprescripts":
+            post, pre = scripts[:i], scripts[i + 1:]
+            break
+
+    def pairs(items):
+        subs = "".join(_tex(item) for item in items[0::2])
+        sups = "".join(_tex(item) for item in items[1::2])
+        return ("_" + _group(subs) if subs else "") + ("^" + _group(sups) if sups else "")
+
+    prefix = pairs(pre)
+    return ("{}" + prefix if prefix else "") + _group(base) + pairs(post)
+
+
+def mathml_to_tex(math):
+    """Convert a <math> element (or MathML source string) to a TeX string."""
+    if isinstance(math, str):
+        math = BeautifulSoup(math, "html.parser").find("math")
+        if math is None:
+            return ""
+    return WHITESPACE_RE.sub(" ", _tex(math)).strip()
+
+
+def _delimited(tex, display):
+    return f"$${tex}$$" if display else f"${tex}$"
+
+
+def _is_rendering(tag):
+    classes = tag.get("class", ())
+    return any(cls.startswith("MathJax") for cls in classes)
+
+
+def replace_mathjax(soup):
+    """Replace rendered MathJax in `soup` with inline $...$ / $$...$$ TeX.
+
+    The TeX comes from the math/mml (or math/tex) source script MathJax keeps
+    next to each rendering. Bare <math> elements are converted too, and any
+    rendering whose source is gone falls back to its glyphs. Returns the number
+    of formulas replaced and the bytes saved.
+    """
+    count = 0
+    saved = 0
+
+    def replace(target, tex, display):
+        nonlocal count, saved
+        replacement = _delimited(tex, display)
+        saved += len(str(target).encode("utf-8")) - len(replacement.encode("utf-8"))
+        target.replace_with(NavigableString(replacement))
+        count += 1
+
+    for script in soup.find_all("script", type=re.compile(r"^math/")):
+        source = script.string or ""
+        display = "mode=display" in script.get("type", "")
+        if script["type"].startswith("math/tex"):
+            tex = WHITESPACE_RE.sub(" ", source).strip()
+        else:
+            math = BeautifulSoup(source, "html.parser").find("math")
+            display = display or (math is not None and math.get("display") == "block")
+            tex = mathml_to_tex(math) if math is not None else ""
+
+        container = script.parent
+        if isinstance(container, Tag) and "math-tex-or-mml" in container.get("class", ()):
+            display = display or container.find(class_="MathJax_Display") is not None
+            target = container
+        else:
+            # No wrapper: the preview/rendering spans are the script's siblings.
+            for sibling in list(script.find_previous_siblings()):
+                if not _is_rendering(sibling):
+                    break
+                display = display or "MathJax_Display" in sibling.get("class", ())
+                saved += len(str(sibling).encode("utf-8"))
+                sibling.decompose()
+            target = script
+        replace(target, tex, display)
+
+    for math in soup.find_all("math"):
+        if math.decomposed:
+            continue
+        replace(math, mathml_to_tex(math), math.get("display") == "block")
+
+    for rendering in soup.find_all(class_=["MathJax", "MathJax_Display"]):
+        if rendering.decomposed:
+            continue
+        tex = WHITESPACE_RE.sub(" ", _glyphs(rendering.get_text())).strip()
+        replace(rendering, tex, "MathJax_Display" in rendering.get("class", ()))
+    for preview in soup.find_all(class_=["MathJax_Preview", "MathJax_MSIE_Separator"]):
+        if not preview.decomposed:
+            saved += len(str(preview).encode("utf-8"))
+            preview.decompose()
+
+    return count, saved
@@ -0,0 +1,312 @@
+"""A local stand-in for the OpenAI endpoints the pipeline uses.
+
+Serves chat completions plus the file and batch endpoints the Batch API mode
+needs, with canned lesson output, so the drivers and batch.run_batch can be
+exercised offline:
+
+    python mock_openai.py --port 8765 &
+    OPENAI_BASE_URL=http://127.0.0.1:8765/v1 OPENAI_API_KEY=x python final_code.py <topic> --batch
+
+With --rpm/--tpm it enforces a request and token quota the way the API does,
+answering with x-ratelimit-* headers and 429s (see bench.py concurrency).
+"""
+import argparse
+import itertools
+import json
+import random
+import re
+import threading
+import time
+from email.parser import BytesParser
+from email.policy import HTTP
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+FILES = {}    # id -> {"meta": file object, "content": bytes}
+BATCHES = {}  # id -> batch object
+LOCK = threading.Lock()
+IDS = itertools.count(1)
+# Prompt prefixes seen so far, to emulate provider-side prompt caching.
+PREFIXES = set()
+PREFIX_BLOCK = 128
+# Replies longer than this many characters are cut off with finish_reason "length".
+MAX_OUTPUT = 0
+# Models answered with 404 model_not_found, and the share of chat requests
+# failed with a 429 (with Retry-After) or a 500.
+UNKNOWN_MODELS = set()
+FAIL_RATE = 0.0
+# Packed requests (see pack.py) get one page per lesson; with --drop-page the
+# last one is left out, to exercise the re-request path.
+LESSON_RE = re.compile(r"^=== LESSON (\d+) ===\n(.*?)\n=== END LESSON \1 ===", re.S | re.M)
+DROP_PAGE = False
+
+
+class Bucket:
+    """A per-minute quota that refills continuously, like the API's rate limits."""
+
+    def __init__(self, per_minute):
+        self.capacity = per_minute
+        self.level = float(per_minute)
+        self.rate = per_minute / 60
+        self.stamp = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.level = min(self.capacity, self.level + (now - self.stamp) * self.rate)
+        self.stamp = now
+
+    def take(self, amount):
+        self._refill()
+        if amount > self.level:
+            return False
+        self.level -= amount
+        return True
+
+    def wait(self, amount):
+        """Seconds until `amount` fits."""
+        self._refill()
+        return max(0.0, (amount - self.level) / self.rate)
+
+    def headers(self, kind):
+        self._refill()
+        return [(f"x-ratelimit-limit-{kind}", str(self.capacity)),
+                (f"x-ratelimit-remaining-{kind}", str(int(self.level))),
+                (f"x-ratelimit-reset-{kind}", f"{(self.capacity - self.level) / self.rate:.3f}s")]
+
+
+REQUESTS = None  # Bucket, with --rpm
+TOKENS = None    # Bucket, with --tpm
+
+
+def _admit(reply):
+    """Charge a reply against the quotas; returns (admitted, x-ratelimit headers, retry-after seconds)."""
+    cost = reply["usage"]["total_tokens"]
+    with LOCK:
+        admitted = True
+        wait = 0.0
+        if REQUESTS is not None and REQUESTS.wait(1) > 0:
+            admitted, wait = False, REQUESTS.wait(1)
+        if TOKENS is not None and TOKENS.wait(cost) > 0:
+            admitted, wait = False, max(wait, TOKENS.wait(cost))
+        if admitted and REQUESTS is not None:
+            REQUESTS.take(1)
+        if admitted and TOKENS is not None:
+            TOKENS.take(cost)
+        headers = (REQUESTS.headers("requests") if REQUESTS else []) + (TOKENS.headers("tokens") if TOKENS else [])
+    return admitted, headers, wait
+
+
+def _new_id(prefix):
+    return f"{prefix}-{next(IDS)}"
+
+
+def completion(body):
+    """A canned chat completion for a request body."""
+    prompt = next(m["content"] for m in body["messages"] if m["role"] == "user")
+    content = f"export default function Page() {{\n  return null;\n}}\n// {len(prompt)} bytes of lesson\n"
+    lessons = LESSON_RE.findall(prompt)
+    if lessons:
+        if DROP_PAGE:
+            lessons = lessons[:-1]
+        content = "\n".join(f"=== PAGE {n} ===\nexport default function Page() {{\n  return null;\n}}\n"
+                            f"// {len(lesson)} bytes of lesson\n=== END PAGE {n} ===" for n, lesson in lessons)
+    # A continuation request carries the reply so far; send only the rest.
+    done = "".join(m["content"] for m in body["messages"] if m["role"] == "assistant")
+    if done and content.startswith(done):
+        content = content[len(done):]
+    finish_reason = "stop"
+    if MAX_OUTPUT and len(content) > MAX_OUTPUT:
+        content, finish_reason = content[:MAX_OUTPUT], "length"
+    prompt_tokens = sum(len(m["content"]) for m in body["messages"]) // 4
+    prefix = json.dumps(body["messages"][:1])
+    cached_tokens = len(prefix) // 4 // PREFIX_BLOCK * PREFIX_BLOCK if prefix in PREFIXES else 0
+    PREFIXES.add(prefix)
+    return {
+        "id": _new_id("chatcmpl"),
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": body["model"],
+        "choices": [{"index": 0, "finish_reason": finish_reason,
+                     "message": {"role": "assistant", "content": content}}],
+        "usage": {"prompt_tokens": prompt_tokens, "completion_tokens": len(content) // 4,
+                  "total_tokens": prompt_tokens + len(content) // 4,
+                  "prompt_tokens_details": {"cached_tokens": cached_tokens}},
+    }
+
+
+def _store_file(content, filename, purpose):
+    file_id = _new_id("file")
+    meta = {"id": file_id, "object": "file", "bytes": len(content), "created_at": int(time.time()),
+            "filename": filename, "purpose": purpose, "status": "processed"}
+    FILES[file_id] = {"meta": meta, "content": content}
+    return meta
+
+
+def _finish(batch):
+    """Run every request of a batch whose processing time has passed."""
+    lines = FILES[batch["input_file_id"]]["content"].decode("utf-8").splitlines()
+    output = []
+    for line in filter(str.strip, lines):
+        request = json.loads(line)
+        output.append(json.dumps({
+            "id": _new_id("batch_req"),
+            "custom_id": request["custom_id"],
+            "response": {"status_code": 200, "request_id": _new_id("req"), "body": completion(request["body"])},
+            "error": None,
+        }))
+    meta = _store_file("\n".join(output).encode("utf-8") + b"\n", f"{batch['id']}_output.jsonl", "batch_output")
+    batch.update(status="completed", output_file_id=meta["id"], completed_at=int(time.time()),
+                 request_counts={"total": len(output), "completed": len(output), "failed": 0})
+
+
+def _public(batch):
+    return {key: value for key, value in batch.items() if not key.startswith("_")}
+
+
+class Handler(BaseHTTPRequestHandler):
+    delay = 0.0
+    batch_seconds = 2.0
+
+    def log_message(self, *args):
+        pass
+
+    def end_headers(self):
+        for name, value in getattr(self, "quota_headers", ()):
+            self.send_header(name, value)
+        super().end_headers()
+
+    def _send(self, status, payload, content_type="application/json"):
+        data = payload if isinstance(payload, bytes) else json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("content-type", content_type)
+        self.send_header("content-length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _stream(self, reply, chunk_size=8):
+        """Send `reply` as server-sent chat.completion.chunk events, like stream=True does."""
+        self.send_response(200)
+        self.send_header("content-type", "text/event-stream")
+        self.end_headers()
+        base = {key: reply[key] for key in ("id", "created", "model")}
+        content = reply["choices"][0]["message"]["content"]
+        pieces = [content[i:i + chunk_size] for i in range(0, len(content), chunk_size)]
+        for i, piece in enumerate(pieces):
+            delta = {"role": "assistant", "content": piece} if i == 0 else {"content": piece}
+            finish_reason = reply["choices"][0]["finish_reason"] if i == len(pieces) - 1 else None
+            event = {**base, "object": "chat.completion.chunk",
+                     "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}]}
+            self.wfile.write(f"data: {json.dumps(event)}\n\n".encode("utf-8"))
+            self.wfile.flush()
+            time.sleep(self.delay / len(pieces))
+        usage = {**base, "object": "chat.completion.chunk", "choices": [], "usage": reply["usage"]}
+        self.wfile.write(f"data: {json.dumps(usage)}\n\ndata: [DONE]\n\n".encode("utf-8"))
+
+    def _error(self, status, message, code=None, headers=()):
+        data = json.dumps({"error": {"message": message, "type": "invalid_request_error", "code": code}})
+        self.send_response(status)
+        for name, value in headers:
+            self.send_header(name, value)
+        self.send_header("content-type", "application/json")
+        self.send_header("content-length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data.encode("utf-8"))
+
+    def _not_found(self):
+        self._send(404, {"error": {"message": f"No route for {self.path}", "type": "invalid_request_error"}})
+
+    def _body(self):
+        return self.rfile.read(int(self.headers.get("content-length", 0)))
+
+    def do_POST(self):
+        body = self._body()
+        if self.path.endswith("/chat/completions"):
+            request = json.loads(body)
+            if request["model"] in UNKNOWN_MODELS:
+                self._error(404, f"The model `{request['model']}` does not exist or you do not have access to it.",
+                            "model_not_found")
+                return
+            if random.random() < FAIL_RATE:
+                if random.random() < 0.5:
+                    self._error(429, "Rate limit reached", "rate_limit_exceeded", [("retry-after", "1")])
+                else:
+                    self._error(500, "The server had an error while processing your request.")
+                return
+            reply = completion(request)
+            admitted, self.quota_headers, wait = _admit(reply)
+            if not admitted:
+                self._error(429, "Rate limit reached for requests", "rate_limit_exceeded",
+                            [("retry-after-ms", str(int(wait * 1000) + 1))])
+                return
+            # A cached prefix skips most of the prompt processing.
+            cached = reply["usage"]["prompt_tokens_details"]["cached_tokens"]
+            time.sleep(self.delay * (0.5 - 0.25 * cached / max(reply["usage"]["prompt_tokens"], 1)))
+            if request.get("stream"):
+                self._stream(reply)
+            else:
+                time.sleep(self.delay / 2)
+                self._send(200, reply)
+        elif self.path.endswith("/files"):
+            header = f"Content-Type: {self.headers['content-type']}\r\n\r\n".encode("utf-8")
+            form = BytesParser(policy=HTTP).parsebytes(header + body)
+            fields = {part.get_param("name", header="content-disposition"): part for part in form.iter_parts()}
+            upload = fields["file"]
+            with LOCK:
+                meta = _store_file(upload.get_payload(decode=True), upload.get_filename() or "upload.jsonl",
+                                   fields["purpose"].get_content().strip())
+            self._send(200, meta)
+        elif self.path.endswith("/batches"):
+            request = json.loads(body)
+            if request["input_file_id"] not in FILES:
+                self._send(400, {"error": {"message": "Unknown input file", "type": "invalid_request_error"}})
+                return
+            batch = {"id": _new_id("batch"), "object": "batch", "endpoint": request["endpoint"],
+                     "completion_window": request["completion_window"], "status": "in_progress",
+                     "input_file_id": request["input_file_id"], "output_file_id": None,
+                     "error_file_id": None, "created_at": int(time.time()),
+                     "metadata": request.get("metadata"), "errors": None,
+                     "request_counts": {"total": 0, "completed": 0, "failed": 0},
+                     "_ready_at": time.time() + self.batch_seconds}
+            with LOCK:
+                BATCHES[batch["id"]] = batch
+            self._send(200, _public(batch))
+        else:
+            self._not_found()
+
+    def do_GET(self):
+        match = re.search(r"/batches/([^/]+)$", self.path)
+        if match and match.group(1) in BATCHES:
+            with LOCK:
+                batch = BATCHES[match.group(1)]
+                if batch["status"] == "in_progress" and time.time() >= batch["_ready_at"]:
+                    _finish(batch)
+            self._send(200, _public(batch))
+            return
+        match = re.search(r"/files/([^/]+)/content$", self.path)
+        if match and match.group(1) in FILES:
+            self._send(200, FILES[match.group(1)]["content"], "application/octet-stream")
+            return
+        self._not_found()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local stand-in for the OpenAI API")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--delay", type=float, default=0.5, help="seconds per chat completion")
+    parser.add_argument("--batch-seconds", type=float, default=2.0, help="seconds until a batch completes")
+    parser.add_argument("--max-output", type=int, default=0, help="cut replies off after this many characters")
+    parser.add_argument("--unknown-model", action="append", default=[], help="answer this model with 404")
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="share of chat requests failed with 429/500")
+    parser.add_argument("--rpm", type=int, default=0, help="requests per minute quota")
+    parser.add_argument("--tpm", type=int, default=0, help="tokens per minute quota")
+    parser.add_argument("--drop-page", action="store_true", help="leave the last page out of packed replies")
+    args = parser.parse_args()
+    REQUESTS = Bucket(args.rpm) if args.rpm else None
+    TOKENS = Bucket(args.tpm) if args.tpm else None
+    MAX_OUTPUT = args.max_output
+    UNKNOWN_MODELS = set(args.unknown_model)
+    FAIL_RATE = args.fail_rate
+    DROP_PAGE = args.drop_page
+    Handler.delay = args.delay
+    Handler.batch_seconds = args.batch_seconds
+    print(f"Mock OpenAI API on http://127.0.0.1:{args.port}/v1")
+    ThreadingHTTPServer(("127.0.0.1", args.port), Handler).serve_forever()
@@ -0,0 +1,56 @@
+import re
+
+# Several small lessons go out in one request, each between these markers, and
+# come back as pages between the matching PAGE markers.
+LESSON_START = "=== LESSON {n} ==="
+LESSON_END = "=== END LESSON {n} ==="
+PAGE_START = "=== PAGE {n} ==="
+PAGE_END = "=== END PAGE {n} ==="
+PAGE_RE = re.compile(r"^=== PAGE (\d+) ===[ \t]*\n(.*?)\n=== END PAGE \1 ===", re.S | re.M)
+FENCE_RE = re.compile(r"\A\s*```[a-z]*\n|\n```\s*\Z")
+
+PACK_PROMPT = """The {count} lessons below are separate pages. Convert each one on its own, exactly as you would \
+if it were the only lesson, and reply with every page in order as
+
+{page_start}
+...the complete lessonN.tsx file...
+{page_end}
+
+using the lesson's number, with nothing before, between or after the pages.
+
+"""
+
+
+def pack_lessons(sizes, budget, max_lessons):
+    """Group lesson indexes so each group's sizes add up to at most `budget`.
+
+    First-fit decreasing over `sizes` (lesson tokens by index); a group holds
+    at most `max_lessons`. Groups come back in lesson order.
+    """
+    bins = []  # [total, [indexes]]
+    for index in sorted(range(len(sizes)), key=lambda i: -sizes[i]):
+        for group in bins:
+            if group[0] + sizes[index] <= budget and len(group[1]) < max_lessons:
+                group[0] += sizes[index]
+                group[1].append(index)
+                break
+        else:
+            bins.append([sizes[index], [index]])
+    return sorted((sorted(indexes) for _, indexes in bins), key=lambda indexes: indexes[0])
+
+
+def pack_prompt(lessons):
+    """One user message holding every lesson in `lessons`, numbered from 1."""
+    parts = [PACK_PROMPT.format(count=len(lessons), page_start=PAGE_START.format(n="N"),
+                                page_end=PAGE_END.format(n="N"))]
+    for n, lesson in enumerate(lessons, 1):
+        parts.append(f"{LESSON_START.format(n=n)}\n{lesson}\n{LESSON_END.format(n=n)}\n")
+    return "\n".join(parts)
+
+
+def split_pages(reply):
+    """{lesson number: page} for every complete page in a packed reply."""
+    pages = {}
+    for match in PAGE_RE.finditer(reply):
+        pages.setdefault(int(match.group(1)), FENCE_RE.sub("", match.group(2).strip()) + "\n")
+    return pages
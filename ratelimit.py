@@ -0,0 +1,159 @@
+import asyncio
+import re
+import time
+
+DURATION_RE = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+DURATION_UNITS = {"ms": 0.001, "s": 1, "m": 60, "h": 3600}
+
+# AIMD: every successful request raises the in-flight limit by INCREASE / limit
+# (about +INCREASE per round of requests); a 429 multiplies it by DECREASE.
+INCREASE = 1.0
+DECREASE = 0.5
+
+
+def parse_duration(value):
+    """Seconds in an x-ratelimit-reset-* value such as "20ms", "1.5s" or "6m0s"."""
+    if not value:
+        return None
+    parts = DURATION_RE.findall(value)
+    if not parts:
+        try:
+            return float(value)
+        except ValueError:
+            return None
+    return sum(float(amount) * DURATION_UNITS[unit] for amount, unit in parts)
+
+
+class Quota:
+    """One rate limit (requests or tokens) as the last response described it.
+
+    The API refills a quota continuously, reaching `limit` after the reset
+    time, so between responses the remaining amount is extrapolated linearly.
+    Amounts spent locally since the last response are subtracted.
+    """
+
+    def __init__(self):
+        self.limit = None
+        self.remaining = None
+        self.rate = None  # units per second, when the limit is known
+        self.stamp = 0.0
+        self.reset_at = 0.0
+        self.spent = 0
+
+    def update(self, limit, remaining, reset, now):
+        if limit is not None:
+            self.limit = limit
+        self.remaining = remaining
+        self.stamp = now
+        self.reset_at = now + (reset if reset is not None else 1.0)
+        self.spent = 0
+        if self.limit is not None and reset:
+            self.rate = max(self.limit - remaining, 0) / reset
+        else:
+            self.rate = None
+
+    def available(self, now):
+        if self.remaining is None or now >= self.reset_at:
+            return float("inf")
+        refill = (now - self.stamp) * self.rate if self.rate is not None else 0
+        return min(self.limit or float("inf"), self.remaining + refill) - self.spent
+
+    def wait(self, amount, now):
+        """Seconds until `amount` is available (0 if it is now)."""
+        shortfall = amount - self.available(now)
+        if shortfall <= 0:
+            return 0.0
+        if self.rate:
+            return min(shortfall / self.rate, self.reset_at - now)
+        return self.reset_at - now
+
+
+class Ticket:
+    """One admitted request: its token reservation and when it started."""
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.started = time.monotonic()
+
+
+class AdaptiveLimiter:
+    """Admission control for API requests, adjusted from rate-limit headers.
+
+    At most `limit` requests are in flight. The limit grows additively while
+    requests succeed and halves on a 429, once per round (a 429 for a request
+    started before the last cut doesn't cut again). Each request reserves its
+    estimated tokens up front and only starts once the x-ratelimit-* headers
+    say the request and token quotas have room for it.
+    """
+
+    def __init__(self, max_concurrency, min_concurrency=1, start=None):
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.limit = float(start or min(4, max_concurrency))
+        self.in_flight = 0
+        self.requests = Quota()
+        self.tokens = Quota()
+        self.paused_until = 0.0
+        self.last_decrease = 0.0
+        self.throttled = 0
+        self.peak = 0
+        self._changed = asyncio.Condition()
+
+    def _wait(self, tokens):
+        """Seconds until a request reserving `tokens` may start; None to wait for a release."""
+        now = time.monotonic()
+        if self.in_flight >= max(int(self.limit), self.min_concurrency):
+            return None
+        # A lesson bigger than the whole token quota can still go once it is full.
+        if self.tokens.limit is not None:
+            tokens = min(tokens, self.tokens.limit)
+        return max(self.paused_until - now, self.requests.wait(1, now), self.tokens.wait(tokens, now))
+
+    async def acquire(self, tokens):
+        """Wait until a request reserving `tokens` may start; returns its Ticket."""
+        async with self._changed:
+            while True:
+                wait = self._wait(tokens)
+                if wait == 0:
+                    break
+                try:
+                    await asyncio.wait_for(self._changed.wait(), wait)
+                except asyncio.TimeoutError:
+                    pass
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+            self.requests.spent += 1
+            self.tokens.spent += tokens
+            return Ticket(tokens)
+
+    def update(self, headers):
+        """Take the quota state from a response's x-ratelimit-* headers."""
+        if not headers:
+            return
+        now = time.monotonic()
+        for kind, quota in (("requests", self.requests), ("tokens", self.tokens)):
+            remaining = headers.get(f"x-ratelimit-remaining-{kind}")
+            if remaining is None:
+                continue
+            limit = headers.get(f"x-ratelimit-limit-{kind}")
+            quota.update(int(limit) if limit is not None else None, int(remaining),
+                         parse_duration(headers.get(f"x-ratelimit-reset-{kind}")), now)
+
+    async def release(self, ticket, headers=None, throttled=False, retry_after=None):
+        """Finish `ticket`'s request and adjust the limit from how it went."""
+        async with self._changed:
+            self.in_flight -= 1
+            self.update(headers)
+            if throttled:
+                self.throttled += 1
+                if retry_after:
+                    self.paused_until = max(self.paused_until, time.monotonic() + retry_after)
+                if ticket.started >= self.last_decrease:
+                    self.limit = max(self.min_concurrency, self.limit * DECREASE)
+                    self.last_decrease = time.monotonic()
+            elif headers is not None:
+                self.limit = min(self.max_concurrency, self.limit + INCREASE / self.limit)
+            self._changed.notify_all()
+
+    def stats(self):
+        return {"limit": round(self.limit, 2), "peak": self.peak, "throttled": self.throttled}
@@ -0,0 +1,65 @@
+import re
+from dataclasses import dataclass
+
+FORMULA_RE = re.compile(r"\$\$.+?\$\$|\$[^$\n]+?\$|<math\b", re.S)
+QUESTION_RE = re.compile(r"<div\b[^>]*\bclass=\"[^\"]*\b(?:example|exercise)\b")
+
+# Score points per unit of each feature; a lesson's score is the weighted sum.
+WEIGHTS = {
+    "tokens": 1.0,     # per 1000 lesson tokens
+    "math": 0.2,       # per formula per 1000 lesson tokens
+    "visuals": 1.5,    # per table or SVG figure
+    "questions": 0.5,  # per worked example or exercise
+}
+
+
+@dataclass
+class LessonProfile:
+    tokens: int
+    formulas: int
+    tables: int
+    svgs: int
+    questions: int
+
+    @property
+    def math_density(self):
+        """Formulas per 1000 lesson tokens."""
+        return self.formulas * 1000 / self.tokens if self.tokens else 0.0
+
+    def score(self, weights=None):
+        weights = weights or WEIGHTS
+        return (weights["tokens"] * self.tokens / 1000 + weights["math"] * self.math_density
+                + weights["visuals"] * (self.tables + self.svgs) + weights["questions"] * self.questions)
+
+
+def profile_lesson(html, tokens):
+    """Count what makes a cleaned lesson body hard to convert."""
+    return LessonProfile(
+        tokens=tokens,
+        formulas=len(FORMULA_RE.findall(html)),
+        tables=html.count("<table"),
+        svgs=html.count("<svg"),
+        questions=len(QUESTION_RE.findall(html)),
+    )
+
+
+def parse_routes(spec):
+    """Parse a policy such as "gpt-5-mini:4,gpt-5" into [(max score, model)].
+
+    Tiers are tried in order; the first whose maximum the score doesn't exceed
+    wins, and a tier without a maximum takes everything left.
+    """
+    routes = []
+    for part in spec.split(","):
+        model, sep, limit = part.strip().rpartition(":")
+        if not sep:
+            model, limit = limit, ""
+        routes.append((float(limit) if limit else None, model))
+    return routes
+
+
+def pick_tier(score, routes):
+    for limit, model in routes:
+        if limit is None or score <= limit:
+            return model
+    return routes[-1][1]
@@ -1,44 +1,448 @@
 import os
+import hashlib
+import html
 from bs4 import BeautifulSoup
 from pathlib import Path
 import glob
 import re
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice, repeat
+
+from cache import CACHE_DIR, DiskCache
+from clean import clean_lesson_body, clean_signature
+from lesson_ids import LessonIds
+
+# Bump whenever the extracted output changes shape, so anything derived from it
+# (caches, fingerprints, built lessons) can tell it is stale.
+EXTRACTOR_VERSION = "1"
+
+# The lesson itself lives in one of these divs; everything else on the page is
+# site chrome (navigation, modals, widgets, tracking scripts).
+LESSON_CLASSES = ("lesson-content", "lesson-description")
+# Pages saved next to the lessons that aren't lessons: index.html is the
+# "Folder Browser" listing of the chapters.
+NON_LESSON_PAGES = {"index.html"}
+
+# Bump whenever lesson_fingerprint changes what it hashes.
+FINGERPRINT_VERSION = "1"
+
+LESSON_CACHE_PATH = os.path.join(CACHE_DIR, "lessons.sqlite")
+FINGERPRINT_CACHE_PATH = os.path.join(CACHE_DIR, "fingerprints.sqlite")
+LESSON_CACHE_MAX_MB = int(os.getenv("LESSON_CACHE_MAX_MB", "512"))
+
+READ_CHUNK_SIZE = 64 * 1024
+# Longest single tag we expect to have to buffer before matching it.
+MAX_TAG_LENGTH = 32 * 1024
+
+# Elements whose content is raw text, so a "<div" inside them is not markup.
+RAW_TEXT_TAGS = ("script", "style", "textarea", "title")
+
+TAG_RE = re.compile(
+    r"<(/?)([a-zA-Z][^\s/>]*)"
+    r"((?:\s+[^\s/>\"'=]+(?:\s*=\s*(?:\"[^\"]*\"|'[^']*'|[^\s\"'=<>`]+))?)*)"
+    r"\s*(/?)>"
+)
+CLASS_ATTR_RE = re.compile(r"""\bclass\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+))""", re.I)
+
+CHECKSUM_RE = re.compile(r"""\bdata-checksum\s*=\s*["']([^"']*)["']""", re.I)
+IMG_SRC_RE = re.compile(r"""<img\b[^>]*?\bsrc\s*=\s*["']([^"']*)["']""", re.I)
+# Scripts and styles other than MathJax's math/* sources carry no lesson content.
+NON_CONTENT_BLOCK_RE = re.compile(
+    r"""<(script|style)\b(?![^>]*\btype\s*=\s*["']math/)[^>]*>.*?</\1\s*>""", re.I | re.S
+)
+ANY_TAG_RE = re.compile(r"<[^>]*>")
+
 
 def natural_sort_key(s):
     """Helper function to sort strings with numbers naturally"""
     return [int(text) if text.isdigit() else text.lower() for text in re.split(r'(\d+)', s)]
 
 
-def extract_body_from_html_files(folder_path):
-    # Dictionary to store results
-    results = []
-    
+def _is_lesson_tag(name, attrs):
+    if name.lower() != "div" or "class" not in attrs.lower():
+        return False
+    match = CLASS_ATTR_RE.search(attrs)
+    if not match:
+        return False
+    classes = next(group for group in match.groups() if group is not None).split()
+    return any(cls in classes for cls in LESSON_CLASSES)
+
+
+def _scan_lesson_content(file):
+    """Stream the page and return the raw source of the first lesson div.
+
+    Only tags are tokenized; text is skipped over and the subtree is sliced out of
+    the original source, so the output is exactly what was saved. Reading stops
+    as soon as the lesson div closes. Returns None when the div is missing or
+    never closes, so the caller can fall back to a full parse.
+    """
+    buf = ""
+    pos = 0
+    eof = False
+    start = None
+    depth = 0
+
+    def fill():
+        nonlocal buf, pos, eof
+        chunk = file.read(READ_CHUNK_SIZE)
+        if not chunk:
+            eof = True
+            return False
+        if start is None:
+            # Nothing before the lesson div is needed again.
+            buf, pos = buf[pos:], 0
+        buf += chunk
+        return True
+
+    while True:
+        lt = buf.find("<", pos)
+        if lt == -1 or (not eof and len(buf) - lt < MAX_TAG_LENGTH):
+            # Make sure a whole tag is buffered before trying to match it.
+            if fill():
+                continue
+            if lt == -1:
+                return None
+
+        if buf.startswith("<!--", lt):
+            pos = lt
+            end = buf.find("-->", pos + 4)
+            while end == -1:
+                if not fill():
+                    return None
+                end = buf.find("-->", pos + 4)
+            pos = end + 3
+            continue
+
+        match = TAG_RE.match(buf, lt)
+        if not match:
+            # A stray "<" in text; step past it.
+            pos = lt + 1
+            continue
+
+        closing, name, attrs, _ = match.groups()
+        pos = match.end()
+        name = name.lower()
+
+        if start is None:
+            if not closing and _is_lesson_tag(name, attrs):
+                start = lt
+                depth = 1
+        elif name == "div":
+            depth += -1 if closing else 1
+            if depth == 0:
+                return buf[start:pos]
+
+        if not closing and name in RAW_TEXT_TAGS:
+            close_re = re.compile(r"</%s\s*>" % name, re.I)
+            end = close_re.search(buf, pos)
+            while not end:
+                if not fill():
+                    return None
+                end = close_re.search(buf, pos)
+            pos = end.end()
+
+
+def _extract_with_html5lib(html_content):
+    """Full html5lib parse, used for pages the streaming scanner can't handle."""
+    soup = BeautifulSoup(html_content, 'html5lib')
+    for cls in LESSON_CLASSES:
+        lesson = soup.find('div', class_=cls)
+        if lesson:
+            return str(lesson)
+    body = soup.find('body')
+    return str(body) if body else None
+
+
+def extract_lesson_body(html_file):
+    """Return the lesson markup of one saved page, or None if there is none."""
+    with open(html_file, 'r', encoding='utf-8') as file:
+        lesson_html = _scan_lesson_content(file)
+        if lesson_html is not None:
+            return lesson_html
+        file.seek(0)
+        html_content = file.read()
+    return _extract_with_html5lib(html_content)
+
+
+def lesson_fingerprint(lesson_html):
+    """Hash of a lesson's content that ignores per-session noise.
+
+    Only the ordered data-checksum values of the sentence spans, image
+    locations without their query strings and the normalized visible text are
+    hashed. Attributes such as data-user-current-date, tracking query strings,
+    tokens and generated ids don't count, so re-saving an unchanged lesson from
+    the browser keeps its fingerprint. Works on raw (uncleaned) lesson markup.
+    """
+    checksums = CHECKSUM_RE.findall(lesson_html)
+    images = [src.split("?", 1)[0] for src in IMG_SRC_RE.findall(lesson_html)]
+    text = ANY_TAG_RE.sub(" ", NON_CONTENT_BLOCK_RE.sub(" ", lesson_html))
+    text = " ".join(html.unescape(text).split())
+
+    digest = hashlib.sha256(f"fingerprint-v{FINGERPRINT_VERSION}\n".encode("utf-8"))
+    for part in (*checksums, "", *images, "", text):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+def _process_page(html_file, clean):
+    """Extract (and optionally clean) one page. Returns (body, note, fingerprint)."""
+    body_html = extract_lesson_body(html_file)
+    fingerprint = lesson_fingerprint(body_html or "")
+    note = ""
+    if body_html and clean:
+        body_html, report = clean_lesson_body(body_html)
+        note = f" (stripped {report.bytes_removed / 1024:.1f} KB, ~{report.tokens_removed} tokens)"
+    return body_html, note, fingerprint
+
+
+def _safe_process_page(html_file, clean):
+    """Returns (html_file, body, note, error, fingerprint)."""
+    try:
+        body_html, note, fingerprint = _process_page(html_file, clean)
+        return html_file, body_html, note, None, fingerprint
+    except Exception as e:
+        return html_file, None, "", f"{type(e).__name__}: {e}", None
+
+
+def _limit_worker_memory(max_memory_mb):
+    """Pool initializer: cap the worker's address space so one runaway page
+    fails with MemoryError instead of taking the machine down."""
+    try:
+        import resource
+    except ImportError:  # not available on Windows
+        return
+    limit = max_memory_mb * 1024 * 1024
+    resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+
+def _iter_computed(html_files, clean, workers, max_memory_mb):
+    """Yield _safe_process_page results in the order of `html_files`."""
+    if workers <= 1 or len(html_files) <= 1:
+        for html_file in html_files:
+            yield _safe_process_page(html_file, clean)
+        return
+
+    initializer, initargs = None, ()
+    if max_memory_mb:
+        initializer, initargs = _limit_worker_memory, (max_memory_mb,)
+    with ProcessPoolExecutor(max_workers=workers, initializer=initializer, initargs=initargs) as pool:
+        # map() hands results back in submission order, however the workers finish.
+        yield from pool.map(_safe_process_page, html_files, repeat(clean), chunksize=4)
+
+
+_lesson_cache = None
+_fingerprint_cache = None
+_lesson_ids = None
+
+
+def get_lesson_cache():
+    """The shared on-disk cache of extracted lesson bodies, opened on first use.
+
+    Bodies are keyed on lesson_fingerprint, so a re-saved but unchanged page
+    maps to the body already stored for it.
+    """
+    global _lesson_cache
+    if _lesson_cache is None:
+        _lesson_cache = DiskCache(LESSON_CACHE_PATH, LESSON_CACHE_MAX_MB * 1024 * 1024)
+    return _lesson_cache
+
+
+def get_lesson_ids():
+    """The shared, persisted lesson id table (see lesson_ids.LessonIds), opened on first use."""
+    global _lesson_ids
+    if _lesson_ids is None:
+        _lesson_ids = LessonIds()
+    return _lesson_ids
+
+
+def get_fingerprint_cache():
+    """The shared on-disk map from source hash to lesson fingerprint."""
+    global _fingerprint_cache
+    if _fingerprint_cache is None:
+        _fingerprint_cache = DiskCache(FINGERPRINT_CACHE_PATH, 64 * 1024 * 1024)
+    return _fingerprint_cache
+
+
+def source_hash(html_file):
+    """sha256 of a saved page with line endings normalized."""
+    with open(html_file, 'rb') as file:
+        content = file.read()
+    return hashlib.sha256(content.replace(b"\r\n", b"\n")).hexdigest()
+
+
+def extractor_version(clean=True):
+    """Identifies how bodies are extracted and cleaned; anything built from them is stale once it changes."""
+    return f"{EXTRACTOR_VERSION}|{clean_signature() if clean else 'raw'}"
+
+
+def _source_key(html_file):
+    return f"{EXTRACTOR_VERSION}|{FINGERPRINT_VERSION}|{source_hash(html_file)}"
+
+
+def page_fingerprint(html_file):
+    """lesson_fingerprint of a saved page, remembered by its source hash."""
+    fingerprints = get_fingerprint_cache()
+    key = _source_key(html_file)
+    fingerprint = fingerprints.get(key)
+    if fingerprint is None:
+        fingerprint = lesson_fingerprint(extract_lesson_body(html_file) or "")
+        fingerprints.put(key, fingerprint)
+    return fingerprint
+
+
+def _iter_processed(html_files, clean, workers, max_memory_mb, cache):
+    """Like _iter_computed, but serves pages from `cache` when it can.
+
+    Pages whose source hash already maps to a fingerprint are looked up
+    directly. The rest are processed; their fingerprint is recorded and the
+    body stored under it.
+    """
+    if cache is None:
+        yield from _iter_computed(html_files, clean, workers, max_memory_mb)
+        return
+
+    version = extractor_version(clean)
+    fingerprints = get_fingerprint_cache()
+    source_keys = {html_file: _source_key(html_file) for html_file in html_files}
+    cached = {}
+    for html_file in html_files:
+        fingerprint = fingerprints.get(source_keys[html_file])
+        if fingerprint is None:
+            cache.misses += 1  # never seen this source, so the body can't be cached
+            continue
+        body_html = cache.get(f"{version}|{fingerprint}")
+        if body_html is not None:
+            cached[html_file] = (body_html, fingerprint)
+
+    computed = _iter_computed([f for f in html_files if f not in cached], clean, workers, max_memory_mb)
+    for html_file in html_files:
+        if html_file in cached:
+            body_html, fingerprint = cached[html_file]
+            yield html_file, body_html, " (cached)", None, fingerprint
+            continue
+        result = next(computed)
+        _, body_html, _, error, fingerprint = result
+        if not error:
+            fingerprints.put(source_keys[html_file], fingerprint)
+            # Pages without a lesson are cached as "" so they aren't re-parsed either.
+            cache.put(f"{version}|{fingerprint}", body_html or "")
+        yield result
+
+
+def _html_files(folder_path):
     # Get all HTML files in the folder
-    html_files = glob.glob(os.path.join(folder_path, "*.html"))
+    html_files = [html_file for html_file in glob.glob(os.path.join(folder_path, "*.html"))
+                  if os.path.basename(html_file).lower() not in NON_LESSON_PAGES]
     
     html_files.sort(key=natural_sort_key)
 
     if not html_files:
         print(f"No HTML files found in {folder_path}")
-        return results
-    
-    print(f"Found {len(html_files)} HTML files in {folder_path}")
-    
-    for html_file in html_files:
-        try:
-            with open(html_file, 'r', encoding='utf-8') as file:
-                html_content = file.read()
-            soup = BeautifulSoup(html_content, 'html5lib')
-            body = soup.find('body')
-            
-            if body:
-                body_html = str(body)
-                results.append(body_html)
-                print(f"✓ Successfully extracted body from {os.path.basename(html_file)}")
-            else:
-                print(f"⚠ No body element found in {os.path.basename(html_file)}")
-                
-        except Exception as e:
-            print(f"✗ Error processing {os.path.basename(html_file)}: {str(e)}")
-    
-    return results
\ No newline at end of file
+    else:
+        print(f"Found {len(html_files)} HTML files in {folder_path}")
+    return html_files
+
+
+def _iter_lessons(processed, folder_path, lesson_ids=None):
+    """Report on processed pages and give each successful one its lesson id.
+
+    Ids come from the source page (ttpN.html is lessonN-1), so a page that
+    fails or goes missing doesn't rename every lesson after it.
+    """
+    lesson_ids = lesson_ids or get_lesson_ids()
+    # A topic already converted keeps its outputs' names (see LessonIds).
+    legacy = (not lesson_ids.seeded(folder_path)
+              and bool(glob.glob(os.path.join(glob.escape(folder_path), "lesson*.tsx"))))
+    count = 0
+    for html_file, body_html, note, error, fingerprint in processed:
+        if error:
+            print(f"✗ Error processing {os.path.basename(html_file)}: {error}")
+        elif body_html:
+            print(f"✓ Successfully extracted body from {os.path.basename(html_file)}{note}")
+            lesson_id = lesson_ids.assign(folder_path, os.path.basename(html_file), fingerprint,
+                                          f"lesson{count}" if legacy else None)
+            yield html_file, lesson_id, body_html
+            count += 1
+        else:
+            print(f"⚠ No body element found in {os.path.basename(html_file)}")
+    lesson_ids.mark_seeded(folder_path)
+
+
+def _resolve_cache(cache):
+    if cache is True:
+        return get_lesson_cache()
+    return cache or None
+
+
+def _cache_counts(cache):
+    return (cache.hits, cache.misses) if cache is not None else (0, 0)
+
+
+def _print_cache_stats(cache, before):
+    if cache is not None:
+        stats = cache.stats()
+        print(f"Lesson cache: {stats['hits'] - before[0]} hits, {stats['misses'] - before[1]} misses, "
+              f"{stats['entries']} entries ({stats['bytes'] / 2**20:.1f} MB)")
+
+
+def iter_lesson_bodies(folder_path, clean=True, workers=1, max_memory_mb=None, cache=True):
+    """Lazily yield (source_path, lesson_id, body) for each page in a folder.
+
+    Pages are read one at a time as the caller asks for them, so only the
+    current lesson is held in memory. With `clean`, site chrome is stripped
+    from each body (see clean.STRIP_RULES) and it is minified at
+    clean.MINIFY_LEVEL before it is yielded.
+
+    With `workers` > 1 pages are processed in a process pool, each worker
+    limited to `max_memory_mb` if given; lessons still come out in
+    natural_sort_key order.
+
+    Bodies are cached on disk keyed on the page's content hash and the
+    extractor/cleaning versions (see get_lesson_cache); pass `cache=False` to
+    bypass it or a DiskCache of your own.
+    """
+    cache = _resolve_cache(cache)
+    before = _cache_counts(cache)
+    html_files = _html_files(folder_path)
+    yield from _iter_lessons(_iter_processed(html_files, clean, workers, max_memory_mb, cache), folder_path)
+    _print_cache_stats(cache, before)
+
+
+def iter_folders_lessons(folder_paths, clean=True, workers=None, max_memory_mb=None, cache=True, lesson_ids=None):
+    """Lazily yield (folder_path, source_path, lesson_id, body) for several topic folders.
+
+    All folders share one process pool of `workers` (default: the number of
+    CPUs), so later topics are extracted while the caller is still busy with
+    earlier ones. Folders come out in the order given, with lesson ids as
+    iter_lesson_bodies gives them, from `lesson_ids` if given (e.g. a
+    read-only LessonIds) or the shared table.
+    """
+    workers = workers or os.cpu_count() or 1
+    cache = _resolve_cache(cache)
+    before = _cache_counts(cache)
+    files_by_folder = {folder_path: _html_files(folder_path) for folder_path in folder_paths}
+    all_files = [html_file for html_files in files_by_folder.values() for html_file in html_files]
+    processed = iter(_iter_processed(all_files, clean, workers, max_memory_mb, cache))
+    for folder_path, html_files in files_by_folder.items():
+        for source_path, lesson_id, body in _iter_lessons(islice(processed, len(html_files)), folder_path, lesson_ids):
+            yield folder_path, source_path, lesson_id, body
+    _print_cache_stats(cache, before)
+
+
+def extract_folders(folder_paths, clean=True, workers=None, max_memory_mb=None, cache=True):
+    """Extract several topic folders at once over one shared process pool.
+
+    Returns {folder_path: [(source_path, lesson_id, body), ...]} with every
+    folder's lessons in natural_sort_key order. `workers` defaults to the
+    number of CPUs.
+    """
+    results = {folder_path: [] for folder_path in folder_paths}
+    for folder_path, source_path, lesson_id, body in iter_folders_lessons(folder_paths, clean, workers,
+                                                                          max_memory_mb, cache):
+        results[folder_path].append((source_path, lesson_id, body))
+    return results
+
+
+def extract_body_from_html_files(folder_path):
+    return [body for _, _, body in iter_lesson_bodies(folder_path)]
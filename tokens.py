@@ -0,0 +1,72 @@
+import functools
+from dataclasses import dataclass
+
+from clean import estimate_tokens
+
+try:
+    import tiktoken
+except ImportError:  # optional; counts fall back to clean.estimate_tokens
+    tiktoken = None
+
+
+@dataclass(frozen=True)
+class ModelInfo:
+    context_window: int
+    max_output: int
+    input_price: float   # USD per million input tokens
+    output_price: float  # USD per million output tokens
+    reasoning: bool = False  # reasoning tokens count against max_completion_tokens
+
+
+# List prices; provider-cached input tokens are billed lower than this.
+MODELS = {
+    "gpt-5": ModelInfo(400_000, 128_000, 1.25, 10.00, reasoning=True),
+    "gpt-5-mini": ModelInfo(400_000, 128_000, 0.25, 2.00, reasoning=True),
+    "gpt-4.1": ModelInfo(1_047_576, 32_768, 2.00, 8.00),
+    "gpt-4.1-mini": ModelInfo(1_047_576, 32_768, 0.40, 1.60),
+    "gpt-4o": ModelInfo(128_000, 16_384, 2.50, 10.00),
+    "gpt-4o-mini": ModelInfo(128_000, 16_384, 0.15, 0.60),
+}
+# For model ids not listed above.
+DEFAULT_MODEL = ModelInfo(128_000, 16_384, 2.50, 10.00)
+# Per-message framing the chat format adds on top of the contents.
+MESSAGE_OVERHEAD = 4
+REPLY_OVERHEAD = 3
+
+
+def model_info(model):
+    if model in MODELS:
+        return MODELS[model]
+    # Dated snapshots such as gpt-4o-2024-08-06 share their family's limits.
+    family = max((name for name in MODELS if model.startswith(name + "-")), key=len, default=None)
+    return MODELS[family] if family else DEFAULT_MODEL
+
+
+@functools.lru_cache(maxsize=None)
+def get_encoder(model):
+    """The tiktoken encoding for `model`, loaded once; None without tiktoken."""
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("o200k_base")
+    except Exception:
+        return None  # e.g. the BPE file can't be downloaded
+
+
+def count_tokens(text, model):
+    encoder = get_encoder(model)
+    if encoder is None:
+        return estimate_tokens(text)
+    return len(encoder.encode(text, disallowed_special=()))
+
+
+def count_message_tokens(messages, model):
+    """Prompt tokens for a chat request made of `messages`."""
+    return sum(count_tokens(message["content"], model) + MESSAGE_OVERHEAD for message in messages) + REPLY_OVERHEAD
+
+
+def cost(model, input_tokens, output_tokens):
+    info = model_info(model)
+    return (input_tokens * info.input_price + output_tokens * info.output_price) / 1_000_000